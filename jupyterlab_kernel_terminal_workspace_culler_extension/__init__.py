@@ -12,15 +12,8 @@ except ImportError:
     __version__ = "dev"
 
 from .culler import ResourceCuller
-from .routes import set_culler, setup_route_handlers
-
-# Global culler instance
-_culler_instance: ResourceCuller | None = None
-
-
-def get_culler() -> ResourceCuller | None:
-    """Return the global culler instance."""
-    return _culler_instance
+# routes holds the single canonical culler reference; get_culler is re-exported
+from .routes import get_culler, set_culler, setup_route_handlers
 
 
 def _jupyter_labextension_paths():
@@ -39,16 +32,19 @@ def _load_jupyter_server_extension(server_app):
     server_app: jupyterlab.labapp.LabApp
         JupyterLab application instance
     """
-    global _culler_instance
-
     # Set up route handlers
     setup_route_handlers(server_app.web_app)
 
-    # Create and start the culler
-    _culler_instance = ResourceCuller(server_app)
-    set_culler(_culler_instance)
-    _culler_instance.start()
+    # Create the culler; start it on the first event loop iteration rather than
+    # inline, so its setup stays off the extension-load critical path
+    culler = ResourceCuller(server_app)
+    set_culler(culler)
+    io_loop = getattr(server_app, "io_loop", None)
+    if io_loop is not None:
+        io_loop.add_callback(culler.start)
+    else:
+        culler.start()
 
     name = "jupyterlab_kernel_terminal_workspace_culler_extension"
     server_app.log.info(f"Registered {name} server extension")
-    server_app.log.info("[Culler] Resource culler initialized and started")
+    server_app.log.info("[Culler] Resource culler initialized")
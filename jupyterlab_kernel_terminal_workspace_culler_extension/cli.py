@@ -1,14 +1,155 @@
 """CLI for jupyterlab_kernel_terminal_workspace_culler_extension."""
 
 import argparse
+import bisect
 import json
 import os
 import subprocess
 import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from urllib.parse import urljoin
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
-import requests
+# requests (with urllib3, charset_normalizer, idna, ssl) is imported lazily by
+# JupyterClient and main, so `--help` and the no-command path never pay for it
+if TYPE_CHECKING:
+    import requests
+
+# Upper bound on concurrent DELETE requests during cull. The session pool is
+# sized from it (pool_maxsize) so no worker ever queues for a socket.
+_MAX_CULL_WORKERS = 32
+
+# Section rule for the human-readable output
+DIVIDER = "-" * 60
+
+# Idle-time buckets: a duration below _IDLE_THRESHOLDS[0] prints in seconds,
+# otherwise bisect picks the (unit, seconds-per-unit) row from _IDLE_UNITS
+_IDLE_THRESHOLDS = (60, 3600, 86400)
+_IDLE_UNITS = ((None, 1), ("m", 60), ("h", 3600), ("d", 86400))
+
+# Jupyter server REST collections; item URLs append the id to these
+_KERNEL_EP = "api/kernels/"
+_TERM_EP = "api/terminals/"
+
+# REST namespace of the server extension (see routes.setup_route_handlers)
+_EXTENSION_NS = "jupyterlab-kernel-terminal-workspace-culler-extension/"
+
+try:
+    import orjson
+except ImportError:  # optional speedup (the "fast" extra); stdlib json otherwise
+    orjson = None
+
+
+def _loads_response(response: "requests.Response") -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize CLI --json output, indented, with orjson when installed.
+
+    Both paths emit raw UTF-8 (orjson cannot escape to ASCII), so the output
+    does not depend on whether the extra is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
+
+
+# Token variables in priority order (JupyterHub API token first)
+_TOKEN_ENV_VARS = ("JUPYTERHUB_API_TOKEN", "JPY_API_TOKEN", "JUPYTER_TOKEN")
+
+
+def _env_token() -> str | None:
+    """First non-empty token from _TOKEN_ENV_VARS, stopping at the first hit."""
+    return next((v for k in _TOKEN_ENV_VARS if (v := os.environ.get(k))), None)
+
+
+def _hub_port() -> str:
+    """Port of a JupyterHub single-user server, from its environment.
+
+    ``JUPYTER_PORT`` wins when set; otherwise the port of the bind URL the hub
+    passes in ``JUPYTERHUB_SERVICE_URL``; otherwise the single-user default.
+    """
+    port = os.environ.get("JUPYTER_PORT")
+    if port:
+        return port
+    service_url = os.environ.get("JUPYTERHUB_SERVICE_URL")
+    if service_url:
+        try:
+            parsed_port = urlparse(service_url).port
+        except ValueError:
+            parsed_port = None
+        if parsed_port:
+            return str(parsed_port)
+    return "8888"
+
+
+# `jupyter server list` result, reused for _SERVER_CACHE_TTL seconds so a cron
+# loop of `cull` calls does not start the Jupyter stack on every invocation
+_SERVER_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "jupyterlab_culler"
+    / "server.json"
+)
+_SERVER_CACHE_TTL = 60
+
+
+def _read_server_cache() -> dict | None:
+    """Return the cached detection result, or None when absent/stale/corrupt."""
+    try:
+        if time.time() - _SERVER_CACHE.stat().st_mtime >= _SERVER_CACHE_TTL:
+            return None
+        cached = json.loads(_SERVER_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+    # Hand-edited or older-format entries: anything off-shape means re-detect
+    if (
+        not isinstance(cached, dict)
+        or not isinstance(cached.get("url"), str)
+        or not isinstance(cached.get("token"), (str, type(None)))
+        or type(cached.get("servers", 1)) is not int
+    ):
+        return None
+    return cached
+
+
+def _write_server_cache(entry: dict) -> None:
+    """Atomically store a detection result; failures only cost the next lookup.
+
+    mkstemp creates the file 0600, matching jupyter's own runtime files, since
+    the entry can hold the server token.
+    """
+    try:
+        _SERVER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_SERVER_CACHE.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, _SERVER_CACHE)
+    except (OSError, TypeError, ValueError):
+        # Unserializable entry, disk full, ...: do not leave the temp file behind
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def invalidate_server_cache() -> None:
+    """Drop the cached detection result (the server it points at is gone)."""
+    try:
+        _SERVER_CACHE.unlink()
+    except OSError:
+        pass
 
 
 def get_jupyter_server_info() -> tuple[str, str | None]:
@@ -16,8 +157,9 @@ def get_jupyter_server_info() -> tuple[str, str | None]:
     Auto-detect JupyterLab base URL and token.
 
     Checks in order:
-    1. jupyter server list --json - query running servers (uses localhost)
-    2. JUPYTERHUB_SERVICE_PREFIX - JupyterHub environment variable
+    1. JUPYTERHUB_SERVICE_PREFIX - JupyterHub environment variable
+    2. jupyter server list --json - query running servers (uses localhost);
+       the result is cached on disk for _SERVER_CACHE_TTL seconds
     3. Default: http://localhost:8888
 
     Token priority (JupyterHub API token takes precedence for API access):
@@ -30,17 +172,31 @@ def get_jupyter_server_info() -> tuple[str, str | None]:
         Tuple of (base_url, token) where token may be None
     """
     # Get token - prioritize JupyterHub API token for proper API access
-    token = (
-        os.environ.get("JUPYTERHUB_API_TOKEN")
-        or os.environ.get("JPY_API_TOKEN")
-        or os.environ.get("JUPYTER_TOKEN")
-    )
+    token = _env_token()
+
+    # Inside a JupyterHub single-user server the environment already says where
+    # the server listens; skip spawning `jupyter server list`, which imports most
+    # of the Jupyter stack (hundreds of ms) only to report the same thing
+    service_prefix = os.environ.get("JUPYTERHUB_SERVICE_PREFIX")
+    if service_prefix:
+        return f"http://127.0.0.1:{_hub_port()}{service_prefix.rstrip('/')}", token
+
+    cached = _read_server_cache()
+    if cached is not None:
+        if cached.get("servers", 1) > 1:
+            print(
+                f"Warning: {cached['servers']} Jupyter servers detected; using the first. "
+                "Pass --server-url to target a specific one.",
+                file=sys.stderr,
+            )
+        return cached["url"], token or cached.get("token")
 
-    # Try to detect from running Jupyter servers (preferred - always uses localhost)
+    # Try to detect from running Jupyter servers (always uses localhost)
     try:
         result = subprocess.run(
             ["jupyter", "server", "list", "--json"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=5,
         )
@@ -56,28 +212,37 @@ def get_jupyter_server_info() -> tuple[str, str | None]:
             server_info = json.loads(lines[0])
             port = server_info.get("port", 8888)
             base_url = server_info.get("base_url", "/").rstrip("/")
+            url = f"http://127.0.0.1:{port}{base_url}"
+            server_token = server_info.get("token")
+            _write_server_cache({"url": url, "token": server_token, "servers": len(lines)})
             # Use server token as fallback if no env token
-            if not token:
-                token = server_info.get("token")
-            return f"http://127.0.0.1:{port}{base_url}", token
+            return url, token or server_token
     except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError):
-        pass  # Fall through to other methods
-
-    # Check for JupyterHub environment
-    service_prefix = os.environ.get("JUPYTERHUB_SERVICE_PREFIX")
-    if service_prefix:
-        port = os.environ.get("JUPYTER_PORT", "8888")
-        return f"http://127.0.0.1:{port}{service_prefix.rstrip('/')}", token
+        pass  # Fall through to the default
 
     # Default
     port = os.environ.get("JUPYTER_PORT", "8888")
     return f"http://localhost:{port}", token
 
 
-def format_idle_time(last_activity: str | datetime | None) -> str:
-    """Format idle time as human-readable string."""
+def _bucket_idle(idle_seconds: float) -> str:
+    """Format an already-computed idle duration as a human-readable string.
+
+    Integer arithmetic only: one decimal place is the remainder in tenths of
+    the unit (truncated), so no float division or float formatting per row.
+    """
+    s = int(idle_seconds)
+    i = bisect.bisect_right(_IDLE_THRESHOLDS, s)
+    if not i:
+        return f"{s}s"
+    unit, div = _IDLE_UNITS[i]
+    return f"{s // div}.{s % div * 10 // div}{unit}"
+
+
+def _parse_activity(last_activity: str | datetime | None) -> datetime | None:
+    """Parse an API timestamp (ISO string or datetime) into an aware datetime."""
     if last_activity is None:
-        return "unknown"
+        return None
 
     if isinstance(last_activity, str):
         last_activity = datetime.fromisoformat(last_activity.replace("Z", "+00:00"))
@@ -85,38 +250,49 @@ def format_idle_time(last_activity: str | datetime | None) -> str:
     if last_activity.tzinfo is None:
         last_activity = last_activity.replace(tzinfo=timezone.utc)
 
-    now = datetime.now(timezone.utc)
-    idle_seconds = (now - last_activity).total_seconds()
+    return last_activity
 
-    if idle_seconds < 60:
-        return f"{idle_seconds:.0f}s"
-    elif idle_seconds < 3600:
-        return f"{idle_seconds / 60:.1f}m"
-    elif idle_seconds < 86400:
-        return f"{idle_seconds / 3600:.1f}h"
-    else:
-        return f"{idle_seconds / 86400:.1f}d"
 
+def _idle(
+    last_activity: str | datetime | None, now: float, human: bool = True
+) -> tuple[float, str | None]:
+    """Return (idle_seconds, idle_time) for one row, parsing the timestamp once.
 
-def format_idle_seconds(last_activity: str | datetime | None) -> float:
-    """Get idle time in seconds."""
-    if last_activity is None:
-        return -1
+    ``now`` is epoch seconds, so each row costs one float subtraction.
+    With ``human=False`` the idle_time string is not built and comes back None.
+    """
+    parsed = _parse_activity(last_activity)
+    if parsed is None:
+        return -1, "unknown" if human else None
+    idle_seconds = now - parsed.timestamp()
+    return idle_seconds, _bucket_idle(idle_seconds) if human else None
 
-    if isinstance(last_activity, str):
-        last_activity = datetime.fromisoformat(last_activity.replace("Z", "+00:00"))
 
-    if last_activity.tzinfo is None:
-        last_activity = last_activity.replace(tzinfo=timezone.utc)
+def format_idle_time(
+    last_activity: str | datetime | None, now: datetime | None = None
+) -> str:
+    """Format idle time as human-readable string."""
+    return _idle(last_activity, now.timestamp() if now else time.time())[1]
+
+
+def format_idle_seconds(
+    last_activity: str | datetime | None, now: datetime | None = None
+) -> float:
+    """Get idle time in seconds (-1 when unknown).
 
-    now = datetime.now(timezone.utc)
-    return (now - last_activity).total_seconds()
+    Pass ``now`` when formatting many rows so they share one reference time.
+    """
+    return _idle(last_activity, now.timestamp() if now else time.time(), human=False)[0]
 
 
 class JupyterClient:
     """Client for Jupyter server REST API."""
 
     def __init__(self, server_url: str, token: str | None = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         self.server_url = server_url.rstrip("/") + "/"
         self.token = token
         self.headers = {"Authorization": f"token {token}"} if token else {}
@@ -125,44 +301,121 @@ class JupyterClient:
             or server_url.startswith("http://127.0.0.1")
             or server_url.startswith("http://[::1]")
         )
+        # One pooled keep-alive session for every call: list and cull issue
+        # many requests back-to-back, and a fresh connection per call pays
+        # the TCP (and TLS) handshake each time. Only GETs are retried on read
+        # errors and gateway errors: a DELETE that timed out after the server
+        # acted would come back 404 and be reported as failed. 503 is left
+        # out because the extension answers it for "culler not initialized",
+        # which should surface at once. Connection errors (the request never
+        # reached the server) are retried for every method. The last response
+        # is returned so raise_for_status still surfaces it as an HTTPError.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=_MAX_CULL_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                allowed_methods=frozenset({"GET"}),
+                status_forcelist=[502, 504],
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self.headers)
+        # Every endpoint answers JSON. Compression and keep-alive need no
+        # header here: requests' defaults already send Accept-Encoding
+        # (gzip, deflate and whatever else urllib3 can decode) and
+        # Connection: keep-alive, and it decompresses transparently.
+        self._session.headers["Accept"] = "application/json"
+        # Set False once an extension endpoint answers 404 (server extension
+        # not loaded), so later extension calls in this process skip the probe
+        self._extension_available: bool | None = None
+
+    def _url(self, endpoint: str) -> str:
+        """Absolute URL for a relative API endpoint.
+
+        ``server_url`` always ends in a slash, so plain concatenation is exact
+        and skips the full parse ``urljoin`` would do on every request.
+        """
+        return self.server_url + endpoint.lstrip("/")
 
     def _get(self, endpoint: str) -> dict | list:
-        url = urljoin(self.server_url, endpoint)
-        response = requests.get(url, headers=self.headers, timeout=10)
+        url = self._url(endpoint)
+        response = self._session.get(url, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return _loads_response(response)
 
     def _delete(self, endpoint: str) -> bool:
-        url = urljoin(self.server_url, endpoint)
-        response = requests.delete(url, headers=self.headers, timeout=10)
+        url = self._url(endpoint)
+        response = self._session.delete(url, timeout=10)
         return response.status_code in (200, 204)
 
-    def list_kernels(self) -> list[dict]:
-        """List all kernels with their status."""
+    def _extension_response(self, response: "requests.Response") -> Any | None:
+        """Decode an extension endpoint response; None when unusable.
+
+        Inspects the status code instead of raising: a 404 means the server
+        extension is not loaded at all, which is remembered for the process.
+        """
+        if response.status_code == 404:
+            self._extension_available = False
+            return None
+        if not response.ok:
+            return None
+        return _loads_response(response)
+
+    def _get_extension(self, endpoint: str) -> Any | None:
+        """GET an extension endpoint; None when the extension is unavailable."""
+        if self._extension_available is False:
+            return None
+        try:
+            response = self._session.get(self._url(_EXTENSION_NS + endpoint), timeout=10)
+            return self._extension_response(response)
+        except Exception:
+            return None
+
+    def list_kernels(self, include_human: bool = True) -> list[dict]:
+        """List all kernels with their status.
+
+        With ``include_human=False`` rows carry ``idle_seconds`` only; callers
+        that report a few of them format the idle time themselves.
+        """
         kernels = self._get("api/kernels")
+        now = time.time()
         result = []
         for k in kernels:
-            result.append({
+            last_activity = k.get("last_activity")
+            idle_seconds, idle_time = _idle(last_activity, now, include_human)
+            row = {
                 "id": k.get("id"),
                 "name": k.get("name"),
                 "execution_state": k.get("execution_state"),
-                "last_activity": k.get("last_activity"),
-                "idle_seconds": format_idle_seconds(k.get("last_activity")),
-                "idle_time": format_idle_time(k.get("last_activity")),
-            })
+                "last_activity": last_activity,
+                "idle_seconds": idle_seconds,
+            }
+            if include_human:
+                row["idle_time"] = idle_time
+            result.append(row)
         return result
 
-    def list_terminals(self) -> list[dict]:
-        """List all terminals with their status."""
+    def list_terminals(self, include_human: bool = True) -> list[dict]:
+        """List all terminals with their status (see list_kernels for the flag)."""
         terminals = self._get("api/terminals")
+        now = time.time()
         result = []
         for t in terminals:
-            result.append({
+            last_activity = t.get("last_activity")
+            idle_seconds, idle_time = _idle(last_activity, now, include_human)
+            row = {
                 "name": t.get("name"),
-                "last_activity": t.get("last_activity"),
-                "idle_seconds": format_idle_seconds(t.get("last_activity")),
-                "idle_time": format_idle_time(t.get("last_activity")),
-            })
+                "last_activity": last_activity,
+                "idle_seconds": idle_seconds,
+            }
+            if include_human:
+                row["idle_time"] = idle_time
+            result.append(row)
         return result
 
     def list_workspaces(self) -> list[dict] | None:
@@ -171,18 +424,21 @@ class JupyterClient:
         Returns None when the extension endpoint is unavailable, so callers can
         tell "no workspaces" from "cannot know".
         """
+        workspaces = self._get_extension("workspaces")
+        if workspaces is None:
+            return None
         try:
-            workspaces = self._get(
-                "jupyterlab-kernel-terminal-workspace-culler-extension/workspaces"
-            )
+            now = time.time()
             result = []
             for w in workspaces:
+                last_modified = w.get("last_modified")
+                idle_seconds, idle_time = _idle(last_modified, now)
                 result.append({
                     "id": w.get("id"),
-                    "last_modified": w.get("last_modified"),
+                    "last_modified": last_modified,
                     "created": w.get("created"),
-                    "idle_seconds": format_idle_seconds(w.get("last_modified")),
-                    "idle_time": format_idle_time(w.get("last_modified")),
+                    "idle_seconds": idle_seconds,
+                    "idle_time": idle_time,
                 })
             return result
         except Exception:
@@ -190,18 +446,15 @@ class JupyterClient:
 
     def shutdown_kernel(self, kernel_id: str) -> bool:
         """Shutdown a kernel."""
-        return self._delete(f"api/kernels/{kernel_id}")
+        return self._delete(_KERNEL_EP + kernel_id)
 
     def terminate_terminal(self, name: str) -> bool:
         """Terminate a terminal."""
-        return self._delete(f"api/terminals/{name}")
+        return self._delete(_TERM_EP + name)
 
     def get_culler_status(self) -> dict | None:
         """Get culler status and settings from the extension."""
-        try:
-            return self._get("jupyterlab-kernel-terminal-workspace-culler-extension/status")
-        except Exception:
-            return None
+        return self._get_extension("status")
 
     def get_terminals_connection(self) -> dict[str, bool] | None:
         """Get terminal connection status from the extension.
@@ -210,10 +463,7 @@ class JupyterClient:
         as "unknown", never as "all disconnected", or an endpoint failure would
         silently remove the open-tab protection and cull connected terminals.
         """
-        try:
-            return self._get("jupyterlab-kernel-terminal-workspace-culler-extension/terminals-connection")
-        except Exception:
-            return None
+        return self._get_extension("terminals-connection")
 
     def cull_workspaces(self, timeout_minutes: int, dry_run: bool = False) -> list[dict] | None:
         """Cull workspaces via the backend extension.
@@ -221,19 +471,16 @@ class JupyterClient:
         Returns None when the extension endpoint is unavailable - callers must
         surface that as an error, not as "nothing to cull".
         """
+        if self._extension_available is False:
+            return None
         try:
-            url = urljoin(
-                self.server_url,
-                "jupyterlab-kernel-terminal-workspace-culler-extension/cull-workspaces",
-            )
-            response = requests.post(
-                url,
-                headers=self.headers,
+            response = self._session.post(
+                self._url(_EXTENSION_NS + "cull-workspaces"),
                 json={"timeout": timeout_minutes, "dry_run": dry_run},
                 timeout=30,
             )
-            response.raise_for_status()
-            return response.json().get("workspaces_culled", [])
+            result = self._extension_response(response)
+            return None if result is None else result.get("workspaces_culled", [])
         except Exception:
             return None
 
@@ -244,11 +491,7 @@ def resolve_server_url_and_token(args: argparse.Namespace) -> tuple[str, str | N
     The token falls back to the documented env chain in every branch, so an
     explicit --server-url without --token still authenticates via JUPYTER_TOKEN.
     """
-    env_token = (
-        os.environ.get("JUPYTERHUB_API_TOKEN")
-        or os.environ.get("JPY_API_TOKEN")
-        or os.environ.get("JUPYTER_TOKEN")
-    )
+    env_token = _env_token()
     if args.server_url:
         return args.server_url, args.token or env_token
     env_url = os.environ.get("JUPYTER_SERVER_URL")
@@ -260,11 +503,19 @@ def resolve_server_url_and_token(args: argparse.Namespace) -> tuple[str, str | N
 
 def cmd_list(client: JupyterClient, args: argparse.Namespace) -> int:
     """List all resources and their idle times."""
-    kernels = client.list_kernels()
-    terminals = client.list_terminals()
-    workspaces = client.list_workspaces()
-    culler_status = client.get_culler_status()
-    terminals_connection = client.get_terminals_connection()
+    # The five endpoints are independent; fetch them together so wall time is
+    # one round-trip rather than five (the pooled session reuses sockets)
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        kernels_f = ex.submit(client.list_kernels)
+        terminals_f = ex.submit(client.list_terminals)
+        workspaces_f = ex.submit(client.list_workspaces)
+        culler_status_f = ex.submit(client.get_culler_status)
+        terminals_connection_f = ex.submit(client.get_terminals_connection)
+    kernels = kernels_f.result()
+    terminals = terminals_f.result()
+    workspaces = workspaces_f.result()
+    culler_status = culler_status_f.result()
+    terminals_connection = terminals_connection_f.result()
 
     # Add connection status to terminals (None = extension unavailable, unknown)
     for t in terminals:
@@ -280,34 +531,34 @@ def cmd_list(client: JupyterClient, args: argparse.Namespace) -> int:
             "workspaces": workspaces,
             "culler": culler_status,
         }
-        print(json.dumps(output, indent=2, default=str))
+        print(_dumps(output))
         return 0
 
-    # Human-readable output - Settings first
-    print("CULLER SETTINGS")
-    print("-" * 60)
+    # Human-readable output - Settings first; buffered and written once
+    out: list[str] = ["CULLER SETTINGS"]
+    out.append(DIVIDER)
     if culler_status:
         settings = culler_status.get("settings", {})
         running = culler_status.get("running", False)
-        print(f"  Status: {'running' if running else 'stopped'}")
-        print(f"  Check interval: {settings.get('cullCheckInterval', '?')} min")
-        print(f"  Kernel culling: {'enabled' if settings.get('kernelCullEnabled') else 'disabled'}, timeout: {settings.get('kernelCullIdleTimeout', '?')} min")
-        print(f"  Terminal culling: {'enabled' if settings.get('terminalCullEnabled') else 'disabled'}, timeout: {settings.get('terminalCullIdleTimeout', '?')} min, disconnected-only: {settings.get('terminalCullDisconnectedOnly', '?')}")
-        print(f"  Workspace culling: {'enabled' if settings.get('workspaceCullEnabled') else 'disabled'}, timeout: {settings.get('workspaceCullIdleTimeout', '?')} min")
+        out.append(f"  Status: {'running' if running else 'stopped'}")
+        out.append(f"  Check interval: {settings.get('cullCheckInterval', '?')} min")
+        out.append(f"  Kernel culling: {'enabled' if settings.get('kernelCullEnabled') else 'disabled'}, timeout: {settings.get('kernelCullIdleTimeout', '?')} min")
+        out.append(f"  Terminal culling: {'enabled' if settings.get('terminalCullEnabled') else 'disabled'}, timeout: {settings.get('terminalCullIdleTimeout', '?')} min, disconnected-only: {settings.get('terminalCullDisconnectedOnly', '?')}")
+        out.append(f"  Workspace culling: {'enabled' if settings.get('workspaceCullEnabled') else 'disabled'}, timeout: {settings.get('workspaceCullIdleTimeout', '?')} min")
     else:
-        print("  (culler extension not available)")
+        out.append("  (culler extension not available)")
 
-    print("\nKERNELS")
-    print("-" * 60)
+    out.append("\nKERNELS")
+    out.append(DIVIDER)
     if kernels:
         for k in kernels:
             state = k["execution_state"] or "unknown"
-            print(f"  {k['id'][:8]}  {state:8}  idle: {k['idle_time']:>8}  ({k['name']})")
+            out.append(f"  {k['id'][:8]}  {state:8}  idle: {k['idle_time']:>8}  ({k['name']})")
     else:
-        print("  (none)")
+        out.append("  (none)")
 
-    print("\nTERMINALS")
-    print("-" * 60)
+    out.append("\nTERMINALS")
+    out.append(DIVIDER)
     if terminals:
         for t in terminals:
             connected = t.get("connected")
@@ -315,30 +566,47 @@ def cmd_list(client: JupyterClient, args: argparse.Namespace) -> int:
                 conn_status = "unknown"
             else:
                 conn_status = "connected" if connected else "disconnected"
-            print(f"  {t['name']:8}  {conn_status:12}  idle: {t['idle_time']:>8}")
+            out.append(f"  {t['name']:8}  {conn_status:12}  idle: {t['idle_time']:>8}")
     else:
-        print("  (none)")
+        out.append("  (none)")
 
-    print("\nWORKSPACES")
-    print("-" * 60)
+    out.append("\nWORKSPACES")
+    out.append(DIVIDER)
     if workspaces:
         for w in workspaces:
             ws_id = w["id"] or "unknown"
             # Server rule: everything not auto-* is protected (named + default)
             protected = "" if ws_id.lstrip("/").startswith("auto-") else " (protected)"
-            print(f"  {ws_id:12}  idle: {w['idle_time']:>8}{protected}")
+            out.append(f"  {ws_id:12}  idle: {w['idle_time']:>8}{protected}")
     elif workspaces is None:
-        print("  (culler extension unavailable)")
+        out.append("  (culler extension unavailable)")
     else:
-        print("  (none)")
+        out.append("  (none)")
 
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
+def _delete_concurrently(calls: list[tuple[Callable[[str], bool], str]]) -> list[bool]:
+    """Run independent DELETE calls on a thread pool; results keep call order.
+
+    Each call blocks on one network round-trip, so running them together cuts
+    wall time from the sum of round-trips to roughly the slowest one. An
+    exception from any call propagates to the caller, as it would serially.
+    """
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_MAX_CULL_WORKERS, len(calls))) as ex:
+        futures = [ex.submit(fn, arg) for fn, arg in calls]
+        return [f.result() for f in futures]
+
+
 def cmd_cull(client: JupyterClient, args: argparse.Namespace) -> int:
     """Cull idle resources."""
-    kernels = client.list_kernels()
-    terminals = client.list_terminals()
+    # Only idle_seconds drives the decision; idle_time strings are built below
+    # for the (usually few) culled rows instead of for every row
+    kernels = client.list_kernels(include_human=False)
+    terminals = client.list_terminals(include_human=False)
 
     # Default timeouts in seconds
     kernel_timeout = args.kernel_timeout * 60
@@ -351,18 +619,18 @@ def cmd_cull(client: JupyterClient, args: argparse.Namespace) -> int:
         "dry_run": args.dry_run,
     }
 
+    # Filter first, act after. Timeouts are >= 1 minute (argparse enforces it),
+    # so "idle beyond timeout" also excludes rows with unknown activity (-1).
+
     # Cull idle kernels (skip busy ones)
-    for k in kernels:
-        if k["execution_state"] == "busy":
-            continue
-        if k["idle_seconds"] > 0 and k["idle_seconds"] > kernel_timeout:
-            if args.dry_run:
-                results["kernels_culled"].append({"id": k["id"], "idle_time": k["idle_time"], "action": "would_cull"})
-            else:
-                success = client.shutdown_kernel(k["id"])
-                results["kernels_culled"].append({"id": k["id"], "idle_time": k["idle_time"], "action": "culled" if success else "failed"})
+    kernel_targets = [
+        k
+        for k in kernels
+        if k["execution_state"] != "busy" and k["idle_seconds"] > kernel_timeout
+    ]
 
     # Cull idle terminals (skip those with an open browser tab unless --include-connected)
+    terminal_targets: list[dict] = []
     terminals_connection: dict[str, bool] | None = (
         {} if args.include_connected else client.get_terminals_connection()
     )
@@ -378,15 +646,36 @@ def cmd_cull(client: JupyterClient, args: argparse.Namespace) -> int:
         exit_code = 1
     else:
         exit_code = 0
-        for t in terminals:
-            if not args.include_connected and terminals_connection.get(t["name"], False):
-                continue
-            if t["idle_seconds"] > 0 and t["idle_seconds"] > terminal_timeout:
-                if args.dry_run:
-                    results["terminals_culled"].append({"name": t["name"], "idle_time": t["idle_time"], "action": "would_cull"})
-                else:
-                    success = client.terminate_terminal(t["name"])
-                    results["terminals_culled"].append({"name": t["name"], "idle_time": t["idle_time"], "action": "culled" if success else "failed"})
+        terminal_targets = [
+            t
+            for t in terminals
+            if (args.include_connected or not terminals_connection.get(t["name"], False))
+            and t["idle_seconds"] > terminal_timeout
+        ]
+
+    # Dry run makes no network calls; a real run issues every DELETE at once
+    if args.dry_run:
+        kernel_actions = ["would_cull"] * len(kernel_targets)
+        terminal_actions = ["would_cull"] * len(terminal_targets)
+    else:
+        outcomes = [
+            "culled" if success else "failed"
+            for success in _delete_concurrently(
+                [(client.shutdown_kernel, k["id"]) for k in kernel_targets]
+                + [(client.terminate_terminal, t["name"]) for t in terminal_targets]
+            )
+        ]
+        kernel_actions = outcomes[: len(kernel_targets)]
+        terminal_actions = outcomes[len(kernel_targets) :]
+
+    results["kernels_culled"] = [
+        {"id": k["id"], "idle_time": _bucket_idle(k["idle_seconds"]), "action": action}
+        for k, action in zip(kernel_targets, kernel_actions)
+    ]
+    results["terminals_culled"] = [
+        {"name": t["name"], "idle_time": _bucket_idle(t["idle_seconds"]), "action": action}
+        for t, action in zip(terminal_targets, terminal_actions)
+    ]
 
     # Cull idle workspaces via backend (fail closed: unavailable is an error,
     # not "nothing to cull")
@@ -401,36 +690,49 @@ def cmd_cull(client: JupyterClient, args: argparse.Namespace) -> int:
     results["workspaces_culled"] = workspaces_culled
 
     if args.json:
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
         return exit_code
 
-    # Human-readable output
+    # Human-readable output, buffered and written once
     prefix = "[DRY RUN] " if args.dry_run else ""
+    out: list[str] = []
 
     if results["kernels_culled"]:
-        print(f"{prefix}Kernels culled:")
+        out.append(f"{prefix}Kernels culled:")
         for k in results["kernels_culled"]:
-            print(f"  {k['id'][:8]}  idle: {k['idle_time']}  ({k['action']})")
+            out.append(f"  {k['id'][:8]}  idle: {k['idle_time']}  ({k['action']})")
     else:
-        print(f"{prefix}No kernels to cull")
+        out.append(f"{prefix}No kernels to cull")
 
     if results["terminals_culled"]:
-        print(f"{prefix}Terminals culled:")
+        out.append(f"{prefix}Terminals culled:")
         for t in results["terminals_culled"]:
-            print(f"  {t['name']}  idle: {t['idle_time']}  ({t['action']})")
+            out.append(f"  {t['name']}  idle: {t['idle_time']}  ({t['action']})")
     else:
-        print(f"{prefix}No terminals to cull")
+        out.append(f"{prefix}No terminals to cull")
 
     if results["workspaces_culled"]:
-        print(f"{prefix}Workspaces culled:")
+        out.append(f"{prefix}Workspaces culled:")
         for w in results["workspaces_culled"]:
-            print(f"  {w['id']}  idle: {w['idle_time']}  ({w['action']})")
+            out.append(f"  {w['id']}  idle: {w['idle_time']}  ({w['action']})")
     else:
-        print(f"{prefix}No workspaces to cull")
+        out.append(f"{prefix}No workspaces to cull")
 
+    sys.stdout.write("\n".join(out) + "\n")
     return exit_code
 
 
+def _positive_minutes(value: str) -> int:
+    """argparse type for a timeout in minutes; must be an integer >= 1."""
+    try:
+        minutes = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if minutes < 1:
+        raise argparse.ArgumentTypeError("timeout must be at least 1 minute")
+    return minutes
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -467,10 +769,10 @@ Examples:
     cull_parser = subparsers.add_parser("cull", help="Cull idle resources")
     cull_parser.add_argument("--json", action="store_true", help="Output as JSON")
     cull_parser.add_argument("--dry-run", action="store_true", help="Simulate culling without actually terminating")
-    cull_parser.add_argument("--kernel-timeout", type=int, default=60, metavar="MIN", help="Kernel idle timeout in minutes (default: 60)")
-    cull_parser.add_argument("--terminal-timeout", type=int, default=60, metavar="MIN", help="Terminal idle timeout in minutes (default: 60)")
+    cull_parser.add_argument("--kernel-timeout", type=_positive_minutes, default=60, metavar="MIN", help="Kernel idle timeout in minutes (default: 60)")
+    cull_parser.add_argument("--terminal-timeout", type=_positive_minutes, default=60, metavar="MIN", help="Terminal idle timeout in minutes (default: 60)")
     cull_parser.add_argument("--include-connected", action="store_true", help="Also cull terminals with an open browser tab or referenced by a workspace (default: skip protected terminals)")
-    cull_parser.add_argument("--workspace-timeout", type=int, default=10080, metavar="MIN", help="Workspace idle timeout in minutes (default: 10080 = 7 days)")
+    cull_parser.add_argument("--workspace-timeout", type=_positive_minutes, default=10080, metavar="MIN", help="Workspace idle timeout in minutes (default: 10080 = 7 days)")
     cull_parser.set_defaults(func=cmd_cull)
 
     args = parser.parse_args(argv)
@@ -483,11 +785,15 @@ Examples:
     # Get server URL and token (from args, JUPYTER_SERVER_URL, or auto-detect)
     server_url, token = resolve_server_url_and_token(args)
 
+    import requests
+
     client = JupyterClient(server_url, token)
 
     try:
         return args.func(client, args)
     except requests.exceptions.ConnectionError:
+        # A cached detection may point at a server that has since stopped
+        invalidate_server_cache()
         print(f"Error: Cannot connect to Jupyter server at {server_url}", file=sys.stderr)
         return 1
     except requests.exceptions.HTTPError as e:
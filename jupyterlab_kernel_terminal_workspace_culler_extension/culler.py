@@ -1,21 +1,101 @@
 """Resource culler for idle kernels, terminals, and workspaces."""
 
+import asyncio
+import bisect
 import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from tornado.ioloop import PeriodicCallback
+from tornado.ioloop import IOLoop
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional speedup (the "fast" extra)
+    _parse_iso = None
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Bound once; used on every timestamp parse and staleness check
+_UTC = timezone.utc
+
+
+def _fromisoformat_z(value: str) -> datetime:
+    """``datetime.fromisoformat`` for Pythons that reject a ``Z`` suffix."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Python 3.11+ parses a trailing Z natively; probe once at import rather than
+# copying every timestamp string to spell the offset out
+try:
+    datetime.fromisoformat("2020-01-01T00:00:00Z")
+    _fromisoformat = datetime.fromisoformat
+except ValueError:
+    _fromisoformat = _fromisoformat_z
+
+
+# Idle-time display for cull_workspaces_with_timeout: durations below each
+# threshold use the matching (suffix, divisor); past the last one, days
+_IDLE_DISPLAY_THRESHOLDS = (3600, 86400)
+_IDLE_DISPLAY_UNITS = (("m", 60), ("h", 3600), ("d", 86400))
+
+
+def _fmt_idle(idle_seconds: float) -> str:
+    """Format an idle duration as minutes, hours or days with one decimal."""
+    suffix, divisor = _IDLE_DISPLAY_UNITS[
+        bisect.bisect_right(_IDLE_DISPLAY_THRESHOLDS, idle_seconds)
+    ]
+    return f"{idle_seconds / divisor:.1f}{suffix}"
+
+
+def _parse_iso_string(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, in C via ciso8601 when it is installed.
+
+    Falls back to ``datetime.fromisoformat`` when ciso8601 is missing or
+    rejects the string.
+    """
+    if _parse_iso is not None:
+        try:
+            return _parse_iso(value)
+        except ValueError:
+            pass
+    return _fromisoformat(value)
+
 
 class ResourceCuller:
     """Culls idle kernels, terminals, and workspaces based on configurable timeouts."""
 
     def __init__(self, server_app: Any) -> None:
         self._server_app = server_app
-        self._periodic_callback: PeriodicCallback | None = None
+
+        # Sweeps are one-shot IOLoop timeouts, each rescheduled when the
+        # previous sweep finishes (see _schedule_next_sweep)
+        self._running = False
+        self._timeout_handle: object | None = None
+        # Seconds until the nearest not-yet-culled resource would expire,
+        # lowered by the sub-cullers during a sweep. Workspace culling runs on
+        # a worker thread alongside the kernel culler, hence the lock
+        self._next_expiry_seconds: float | None = None
+        self._expiry_lock = threading.Lock()
+        # Held for the duration of a sweep (and of a manual workspace cull); a
+        # sweep that finds it taken is dropped, so slow shutdowns can never
+        # pile sweeps up
+        self._sweep_lock = asyncio.Lock()
+        # Debounced restart after an interval change (see update_settings)
+        self._pending_restart_handle: object | None = None
+        # Last get_status() result, reused until settings or running state change
+        self._status_cache: dict[str, Any] | None = None
+        # Worker-thread jobs shared by concurrent request handlers (see _single_flight)
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
 
         # Default settings
         self._kernel_cull_enabled = True
@@ -27,41 +107,82 @@ class ResourceCuller:
         self._workspace_cull_idle_timeout = 10080  # minutes (7 days)
         self._cull_check_interval = 5  # minutes
 
-        # Last culling result for notification polling
-        self._last_cull_result: dict[str, list[str]] = {
-            "kernels_culled": [],
-            "terminals_culled": [],
-            "workspaces_culled": [],
-        }
-        self._result_consumed = True  # Track if frontend has fetched the result
+        # Culling results not yet fetched by the frontend, one entry per sweep
+        # that culled something; get_last_cull_result drains and merges them,
+        # so sweeps landing between two polls are all reported. Bounded: with
+        # no frontend polling, only the newest results are kept.
+        self._pending_results: deque[dict[str, list[str]]] = deque(
+            maxlen=self._PENDING_RESULTS_MAX
+        )
+        # Set while results are pending; wakes long-pollers
+        self._result_event = asyncio.Event()
 
         # Active terminals reported by frontend, keyed by client id ->
-        # (names, last report time, client report interval in minutes).
+        # (names, last report time in epoch seconds, client report interval in minutes).
         # Kept per-client and unioned so one client's report cannot clobber another's
         # (a terminal open in any client is protected); stale clients expire (see TTL below).
-        self._active_terminals_by_client: dict[str, tuple[set[str], datetime, int]] = {}
+        # Name sets are frozen: a report replaces its entry wholesale, so a set
+        # handed out to a pass (or a worker thread) can never change under it.
+        self._active_terminals_by_client: dict[
+            str, tuple[frozenset[str], float, int]
+        ] = {}
+        # Union of the reports above, rebuilt only after a report or a prune
+        # changes them (None = stale); polls and sweeps share one snapshot
+        self._active_names_snapshot: frozenset[str] | None = None
 
         # When each terminal last had evidence of an open tab (websocket client or
         # fresh report). A terminal whose tab closes or disconnects gets a fresh
         # idle-timeout grace from that moment, so a transient websocket loss
         # (network blip, sleep/wake) cannot cull it on the next check.
-        self._terminal_tab_last_seen: dict[str, datetime] = {}
+        self._terminal_tab_last_seen: dict[str, float] = {}  # epoch seconds
+
+        # Parsed activity timestamps per resource kind, keyed by resource id:
+        # (raw last_activity value, epoch seconds). A sweep reuses the epoch
+        # while the manager reports the same value, and keeps only the ids it
+        # saw, so entries for vanished resources drop out.
+        self._activity_epochs: dict[str, dict[str, tuple[Any, float]]] = {
+            "kernel": {},
+            "terminal": {},
+            "workspace": {},
+        }
 
-        # Workspace manager (lazy initialization)
+        # Workspace manager (lazy initialization). The resolved directory is
+        # kept, and a failed attempt is not retried before the monotonic time
+        # below (see workspace_manager)
         self._workspace_manager: Any = None
-
-    @property
+        self._workspaces_dir: Path | None = None
+        self._workspace_manager_retry_at = 0.0
+        # Last workspace listing as (monotonic time, manager, workspaces); see
+        # _list_workspaces_cached
+        self._ws_cache: tuple[float, Any, list[dict[str, Any]]] | None = None
+        # (manager, oldest cull-eligible last_modified epoch, directory entry
+        # names) from the last workspace pass; see _cull_workspaces
+        self._workspace_oldest_epoch: tuple[Any, float, frozenset[str]] | None = None
+
+        # Terminal manager, resolved on first non-None lookup (see terminal_manager)
+        self._terminal_manager: Any = None
+
+    @cached_property
     def kernel_manager(self) -> Any:
-        """Access the kernel manager from jupyter_server."""
+        """Access the kernel manager from jupyter_server (resolved once)."""
         return self._server_app.kernel_manager
 
     @property
     def terminal_manager(self) -> Any:
-        """Access the terminal manager from jupyter_server."""
-        # Terminal manager may be on server_app or in web_app settings
-        if hasattr(self._server_app, "terminal_manager"):
-            return self._server_app.terminal_manager
-        return self._server_app.web_app.settings.get("terminal_manager")
+        """Access the terminal manager from jupyter_server.
+
+        Cached once found. A miss is not cached: jupyter_server_terminals may
+        register its manager after this extension loads.
+        """
+        if self._terminal_manager is None:
+            # Terminal manager may be on server_app or in web_app settings
+            if hasattr(self._server_app, "terminal_manager"):
+                self._terminal_manager = self._server_app.terminal_manager
+            else:
+                self._terminal_manager = self._server_app.web_app.settings.get(
+                    "terminal_manager"
+                )
+        return self._terminal_manager
 
     def _resolve_workspaces_dir(self) -> Path:
         """Resolve the workspaces directory the running server actually uses.
@@ -89,21 +210,34 @@ class ResourceCuller:
 
             return Path(jupyter_config_dir()) / "lab" / "workspaces"
 
+    # How often a missing workspaces directory is looked for again. Not
+    # never: JupyterLab creates it on the first workspace save, and until the
+    # manager exists workspace-referenced terminals are not protected
+    _WORKSPACES_DIR_RECHECK_SECONDS = 60.0
+
     @property
     def workspace_manager(self) -> Any:
         """Access the workspace manager from jupyterlab_server."""
-        if self._workspace_manager is None:
+        if (
+            self._workspace_manager is None
+            and time.monotonic() >= self._workspace_manager_retry_at
+        ):
             try:
                 from jupyterlab_server.workspaces_handler import WorkspacesManager
 
-                workspaces_dir = self._resolve_workspaces_dir()
-                if workspaces_dir.exists():
-                    self._workspace_manager = WorkspacesManager(str(workspaces_dir))
+                if self._workspaces_dir is None:
+                    self._workspaces_dir = self._resolve_workspaces_dir()
+                if self._workspaces_dir.exists():
+                    self._workspace_manager = WorkspacesManager(str(self._workspaces_dir))
                 else:
+                    self._workspace_manager_retry_at = (
+                        time.monotonic() + self._WORKSPACES_DIR_RECHECK_SECONDS
+                    )
                     logger.warning(
-                        f"[Culler] Workspaces directory not found: {workspaces_dir}"
+                        "[Culler] Workspaces directory not found: %s", self._workspaces_dir
                     )
             except ImportError:
+                self._workspace_manager_retry_at = math.inf
                 logger.warning(
                     "[Culler] jupyterlab_server not available for workspace management"
                 )
@@ -140,99 +274,258 @@ class ResourceCuller:
                 raise ValueError(f"{key} must be {kind}")
             validated[attr] = max(1, value) if expected is int else value
 
-        old_interval = self._cull_check_interval
-        for attr, value in validated.items():
+        # Apply only the delta: the frontend re-sends every setting on each
+        # save and on page load, which usually changes nothing
+        changed = {
+            attr: value for attr, value in validated.items() if getattr(self, attr) != value
+        }
+        if not changed:
+            return
+        for attr, value in changed.items():
             setattr(self, attr, value)
+        self._status_cache = None
+
+        if not changed.keys().isdisjoint(self._ENABLE_FLAGS):
+            self._reconcile_schedule()
+
+        if "_workspace_cull_idle_timeout" in changed or "_workspace_cull_enabled" in changed:
+            # Re-scan on the next pass instead of trusting the old bound
+            self._workspace_oldest_epoch = None
+
+        if "_cull_check_interval" in changed and self._running:
+            # Restart so the pending sweep honours the new interval. Debounced:
+            # dragging the interval slider sends a burst of updates, and only
+            # the last one needs to restart the timer
+            io_loop = IOLoop.current()
+            if self._pending_restart_handle is not None:
+                io_loop.remove_timeout(self._pending_restart_handle)
+            self._pending_restart_handle = io_loop.call_later(
+                self._RESTART_DEBOUNCE_SECONDS, self._apply_interval_change
+            )
+
+        logger.info(
+            "[Culler] Settings updated: kernel=%s/%smin, terminal=%s/%smin"
+            "(disconnected_only=%s), workspace=%s/%smin, interval=%smin",
+            self._kernel_cull_enabled,
+            self._kernel_cull_idle_timeout,
+            self._terminal_cull_enabled,
+            self._terminal_cull_idle_timeout,
+            self._terminal_cull_disconnected_only,
+            self._workspace_cull_enabled,
+            self._workspace_cull_idle_timeout,
+            self._cull_check_interval,
+        )
 
-        if self._cull_check_interval != old_interval and self._periodic_callback is not None:
-            # Restart periodic callback with new interval
+    # Quiet period after the last interval change before the timer restarts
+    _RESTART_DEBOUNCE_SECONDS = 0.5
+
+    def _apply_interval_change(self) -> None:
+        """Restart the timer on the current interval (debounced from update_settings)."""
+        self._pending_restart_handle = None
+        if self._running:
             self.stop()
             self.start()
 
-        logger.info(
-            f"[Culler] Settings updated: kernel={self._kernel_cull_enabled}/{self._kernel_cull_idle_timeout}min, "
-            f"terminal={self._terminal_cull_enabled}/{self._terminal_cull_idle_timeout}min"
-            f"(disconnected_only={self._terminal_cull_disconnected_only}), "
-            f"workspace={self._workspace_cull_enabled}/{self._workspace_cull_idle_timeout}min, "
-            f"interval={self._cull_check_interval}min"
-        )
+    # Settings whose change can park or re-arm the sweep timer
+    _ENABLE_FLAGS = frozenset(
+        {"_kernel_cull_enabled", "_terminal_cull_enabled", "_workspace_cull_enabled"}
+    )
 
     def get_settings(self) -> dict[str, Any]:
         """Return current settings."""
-        return {
-            "kernelCullEnabled": self._kernel_cull_enabled,
-            "kernelCullIdleTimeout": self._kernel_cull_idle_timeout,
-            "terminalCullEnabled": self._terminal_cull_enabled,
-            "terminalCullIdleTimeout": self._terminal_cull_idle_timeout,
-            "terminalCullDisconnectedOnly": self._terminal_cull_disconnected_only,
-            "workspaceCullEnabled": self._workspace_cull_enabled,
-            "workspaceCullIdleTimeout": self._workspace_cull_idle_timeout,
-            "cullCheckInterval": self._cull_check_interval,
-        }
+        return {key: getattr(self, attr) for key, (attr, _type) in self._SETTING_SPEC.items()}
 
     def get_status(self) -> dict[str, Any]:
-        """Return culler status including settings and running state."""
-        return {
-            "running": self._periodic_callback is not None,
-            "settings": self.get_settings(),
-        }
+        """Return culler status including settings and running state.
+
+        The frontend polls this, so the same dict is handed back until a
+        setting or the running state changes; callers must not mutate it.
+        """
+        status = self._status_cache
+        if status is None or status["running"] != self._running:
+            status = self._status_cache = {
+                "running": self._running,
+                "settings": self.get_settings(),
+            }
+        return status
+
+    # Shortest delay between sweeps, however close the next expiry is
+    _MIN_CHECK_DELAY_SECONDS = 60
 
     def start(self) -> None:
         """Start the periodic culling task."""
-        if self._periodic_callback is not None:
+        if self._running:
             logger.warning("[Culler] Already running, ignoring start request")
             return
 
-        interval_ms = self._cull_check_interval * 60 * 1000
-        self._periodic_callback = PeriodicCallback(
-            self._cull_idle_resources, interval_ms
-        )
-        self._periodic_callback.start()
+        self._running = True
+        self._schedule_next_sweep(self._cull_check_interval * 60)
         logger.info(
-            f"[Culler] Started with check interval of {self._cull_check_interval} minutes"
+            "[Culler] Started with check interval of %s minutes", self._cull_check_interval
         )
 
     def stop(self) -> None:
         """Stop the periodic culling task."""
-        if self._periodic_callback is not None:
-            self._periodic_callback.stop()
-            self._periodic_callback = None
+        if self._running:
+            self._running = False
+            io_loop = IOLoop.current()
+            if self._timeout_handle is not None:
+                io_loop.remove_timeout(self._timeout_handle)
+                self._timeout_handle = None
+            if self._pending_restart_handle is not None:
+                io_loop.remove_timeout(self._pending_restart_handle)
+                self._pending_restart_handle = None
+            # Re-resolve the managers on the next start
+            self.__dict__.pop("kernel_manager", None)
+            self._terminal_manager = None
             logger.info("[Culler] Stopped")
 
+    def _any_cull_enabled(self) -> bool:
+        """True when at least one resource type is set to be culled."""
+        return (
+            self._kernel_cull_enabled
+            or self._terminal_cull_enabled
+            or self._workspace_cull_enabled
+        )
+
+    def _schedule_next_sweep(self, delay_seconds: float) -> None:
+        """Arm the one-shot timeout for the next sweep.
+
+        With every resource type disabled a sweep has nothing to do, so the
+        timer is parked instead (the culler still counts as running);
+        _reconcile_schedule re-arms it once something is enabled again.
+        """
+        io_loop = IOLoop.current()
+        if self._timeout_handle is not None:
+            io_loop.remove_timeout(self._timeout_handle)
+            self._timeout_handle = None
+        if self._any_cull_enabled():
+            self._timeout_handle = io_loop.call_later(delay_seconds, self._run_scheduled_sweep)
+        else:
+            logger.debug("[Culler] All culling disabled, sweep timer parked")
+
+    def _reconcile_schedule(self) -> None:
+        """Park or re-arm the sweep timer after the enable flags changed."""
+        if not self._running:
+            return
+        if not self._any_cull_enabled():
+            self._schedule_next_sweep(0)  # parks
+        elif self._timeout_handle is None:
+            self._schedule_next_sweep(self._cull_check_interval * 60)
+
+    async def _run_scheduled_sweep(self) -> None:
+        """Run one sweep, then schedule the next one interval later (or
+        earlier, when a resource is about to expire)."""
+        self._timeout_handle = None
+        try:
+            await self._cull_idle_resources()
+        finally:
+            if self._running:
+                self._schedule_next_sweep(self._early_wakeup_delay())
+
+    def _note_expiry(self, remaining_seconds: float) -> None:
+        """Record a surviving resource's time left before its idle timeout."""
+        with self._expiry_lock:
+            if self._next_expiry_seconds is None or remaining_seconds < self._next_expiry_seconds:
+                self._next_expiry_seconds = remaining_seconds
+
+    def _early_wakeup_delay(self) -> float:
+        """Delay before the next sweep: the check interval, shortened to the
+        nearest expiry the last sweep saw (but never below
+        _MIN_CHECK_DELAY_SECONDS).
+
+        This only wakes the culler early for imminent expiries; it never
+        stretches the fixed check interval, because expiries a sweep cannot
+        predict (a busy kernel going idle, a protected terminal losing its
+        protection, a newly created resource) must still be seen in time.
+        """
+        interval_seconds = self._cull_check_interval * 60
+        if self._next_expiry_seconds is None:
+            return interval_seconds
+        return min(
+            interval_seconds,
+            max(self._MIN_CHECK_DELAY_SECONDS, self._next_expiry_seconds),
+        )
+
+    # Sweeps whose results are kept while nobody fetches them
+    _PENDING_RESULTS_MAX = 32
+
     def get_last_cull_result(self) -> dict[str, list[str]]:
-        """Return last culling result and mark as consumed."""
-        if self._result_consumed:
-            return {"kernels_culled": [], "terminals_culled": [], "workspaces_culled": []}
-        self._result_consumed = True
-        return self._last_cull_result
+        """Return everything culled since the last call, and clear it."""
+        merged: dict[str, list[str]] = {
+            "kernels_culled": [],
+            "terminals_culled": [],
+            "workspaces_culled": [],
+        }
+        for result in self._pending_results:
+            for key, names in result.items():
+                merged[key].extend(names)
+        self._pending_results.clear()
+        self._result_event.clear()
+        return merged
+
+    async def wait_for_cull_result(self, timeout: float) -> dict[str, list[str]]:
+        """Long-poll form of get_last_cull_result.
+
+        Returns at once when an unconsumed result is pending, otherwise waits
+        up to ``timeout`` seconds for the next sweep that culls something.
+        """
+        if not self._pending_results:
+            try:
+                await asyncio.wait_for(self._result_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.get_last_cull_result()
 
-    def get_terminals_connection_status(self) -> dict[str, bool]:
+    async def get_terminals_connection_status_async(self) -> dict[str, bool]:
         """Return protection status for all terminals.
 
         True when a terminal has an open tab OR is referenced by an existing
         workspace (both protect it from culling); also True when workspace
         references cannot be verified, so CLI consumers fail safe too.
+
+        A failure to list terminals propagates instead of returning a partial
+        map: a missing name reads as "not protected" to the CLI, while an
+        error response makes it skip terminal culling (fail closed).
+
+        The workspace scan runs on a worker thread, and polls arriving while
+        one is in flight share it; the rest runs on the IOLoop, which owns
+        the terminal registry.
         """
+        if self.terminal_manager is None:
+            return {}
+        ws_referenced = await self._single_flight(
+            "workspace_references", self._workspace_referenced_terminals
+        )
+        return self._connection_status(ws_referenced)
+
+    def _connection_status(self, ws_referenced: set[str] | None) -> dict[str, bool]:
+        """Protection map for all terminals given the workspace references."""
+        if ws_referenced is None:
+            protected = None
+        else:
+            protected = self._open_tab_terminals() | ws_referenced
         result: dict[str, bool] = {}
-        terminal_mgr = self.terminal_manager
-        if terminal_mgr is None:
-            return result
+        for terminal in self.terminal_manager.list():
+            name = terminal.get("name")
+            if name:
+                result[name] = protected is None or name in protected
+        return result
 
-        ws_referenced = self._workspace_referenced_terminals()
-        try:
-            terminals = terminal_mgr.list()
-            for terminal in terminals:
-                name = terminal.get("name")
-                if name:
-                    result[name] = (
-                        self._terminal_has_active_tab(name)
-                        or ws_referenced is None
-                        or name in ws_referenced
-                    )
-        except Exception:
-            pass
+    async def _single_flight(self, key: str, func: Callable[[], _T]) -> _T:
+        """Run ``func`` on a worker thread, one run per key at a time.
 
-        return result
+        Callers arriving while a run is in flight await that run instead of
+        starting their own, so N browser tabs polling together cost one
+        workspace scan. Errors reach every waiter.
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(func))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _done: self._in_flight.pop(key, None))
+        # shielded: one cancelled request must not cancel the others' result
+        return await asyncio.shield(future)
 
     # A live frontend re-reports every check interval; drop a client silent for
     # this many intervals so a closed browser stops protecting its terminals.
@@ -253,64 +546,97 @@ class ResourceCuller:
         """
         if type(interval_minutes) is not int or interval_minutes < 1:
             interval_minutes = self._cull_check_interval
-        now = datetime.now(timezone.utc)
-        self._active_terminals_by_client[client_id] = (
-            set(terminals),
-            now,
-            interval_minutes,
-        )
+        now = time.time()
+        names = frozenset(terminals)
+        previous = self._active_terminals_by_client.get(client_id)
+        if previous is not None and previous[0] == names:
+            # The usual repost (every interval and on tab focus) changes
+            # nothing but the report time: keep the stored set and the union
+            names = previous[0]
+        else:
+            self._active_names_snapshot = None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[Culler] Active terminals for client %s: %s", client_id, sorted(names)
+                )
+        self._active_terminals_by_client[client_id] = (names, now, interval_minutes)
         # Prune on every write so the map stays bounded even when no culling
         # path (which would otherwise prune) ever runs
         self._prune_stale_clients(now)
-        logger.debug(f"[Culler] Active terminals for client {client_id}: {terminals}")
 
-    def _prune_stale_clients(self, now: datetime) -> None:
+    def _prune_stale_clients(self, now: float) -> None:
         """Drop clients silent beyond their own report-interval TTL."""
+        ttl_per_interval = self._ACTIVE_TERMINAL_STALE_INTERVALS * 60
         stale = [
             client_id
             for client_id, (_names, reported_at, interval) in self._active_terminals_by_client.items()
-            if (now - reported_at).total_seconds()
-            > interval * self._ACTIVE_TERMINAL_STALE_INTERVALS * 60
+            if now - reported_at > interval * ttl_per_interval
         ]
         for client_id in stale:
             del self._active_terminals_by_client[client_id]
+        if stale:
+            self._active_names_snapshot = None
 
-    def _active_terminal_names(self) -> set[str]:
+    def _active_terminal_names(self) -> frozenset[str]:
         """Union of terminals reported open by any client with a recent report.
 
         Entries from clients silent for more than ``_ACTIVE_TERMINAL_STALE_INTERVALS``
         of their own report intervals are pruned, so a closed browser tab no longer
         protects its terminals from culling.
         """
-        self._prune_stale_clients(datetime.now(timezone.utc))
-        active: set[str] = set()
-        for names, _reported_at, _interval in self._active_terminals_by_client.values():
-            active |= names
-        return active
+        self._prune_stale_clients(time.time())
+        snapshot = self._active_names_snapshot
+        if snapshot is None:
+            snapshot = self._active_names_snapshot = frozenset().union(
+                *(names for names, _reported_at, _interval in self._active_terminals_by_client.values())
+            )
+        return snapshot
 
-    def _terminal_has_ws_client(self, name: str) -> bool:
-        """True when at least one websocket client is attached to the terminal.
+    def _open_tab_terminals(self) -> frozenset[str]:
+        """All terminals with an open tab, resolved once for a whole pass:
+        those with a live websocket client plus those reported by a client.
 
         An open terminal tab holds an open websocket to its terminal (terminado
         registers every connection in ``PtyWithClients.clients``), so this is
         ground truth the server observes directly. Frontend reports alone are
         not enough: browsers throttle or freeze timers in background tabs, so a
         client with an open tab can go silent past the report TTL and its
-        terminal would lose protection despite the tab being open.
+        terminal would lose protection despite the tab being open. A
+        non-terminado manager without a per-pty registry falls back to reports.
         """
+        open_tabs = self._active_terminal_names()
         terminals = getattr(self.terminal_manager, "terminals", None)
-        if not isinstance(terminals, dict):
-            # Non-terminado manager without a per-pty registry; fall back to reports
-            return False
-        pty = terminals.get(name)
-        return bool(pty is not None and getattr(pty, "clients", None))
+        if isinstance(terminals, dict):
+            open_tabs = open_tabs.union(
+                name for name, pty in terminals.items() if getattr(pty, "clients", None)
+            )
+        return open_tabs
+
+    # How long polls and reference checks reuse a workspace listing
+    _WORKSPACE_LISTING_TTL_SECONDS = 5.0
 
-    def _terminal_has_active_tab(self, name: str) -> bool:
-        """Check if a terminal has an open tab: a live websocket client
-        (ground truth) or a recent frontend report naming it."""
-        return self._terminal_has_ws_client(name) or name in self._active_terminal_names()
+    def _list_workspaces_cached(self, ws_mgr: Any, fresh: bool = False) -> list[dict[str, Any]]:
+        """Workspace listing, reused for up to _WORKSPACE_LISTING_TTL_SECONDS.
 
-    def _workspace_referenced_terminals(self) -> set[str] | None:
+        Listing reads every workspace file, and the frontend and CLI poll the
+        endpoints built on it. Cull decisions pass ``fresh=True`` so a
+        workspace saved moments ago is never judged on a stale timestamp;
+        deletes invalidate the cache. Errors propagate and are not cached.
+        """
+        cached = self._ws_cache
+        if (
+            not fresh
+            and cached is not None
+            and cached[1] is ws_mgr
+            and time.monotonic() - cached[0] < self._WORKSPACE_LISTING_TTL_SECONDS
+        ):
+            return cached[2]
+        listed_at = time.monotonic()
+        workspaces = list(ws_mgr.list_workspaces())
+        self._ws_cache = (listed_at, ws_mgr, workspaces)
+        return workspaces
+
+    def _workspace_referenced_terminals(self, fresh: bool = False) -> set[str] | None:
         """Terminal names referenced by any existing workspace's layout.
 
         A terminal open in a workspace that has not been culled must never be
@@ -322,24 +648,27 @@ class ResourceCuller:
         Returns None when workspaces exist but cannot be listed (caller must
         fail safe and skip terminal culling), and an empty set when there is
         no workspace manager at all (no workspace concept, e.g. bare
-        jupyter_server).
+        jupyter_server). The cull path passes ``fresh=True``: a listing a
+        poll cached seconds ago may miss a workspace that now holds a terminal.
         """
         ws_mgr = self.workspace_manager
         if ws_mgr is None:
             return set()
         try:
             referenced: set[str] = set()
-            for ws in ws_mgr.list_workspaces():
+            for ws in self._list_workspaces_cached(ws_mgr, fresh=fresh):
                 for key in ws.get("data", {}):
                     if key.startswith("terminal:"):
                         referenced.add(key.split(":", 1)[1])
             return referenced
         except Exception as e:
-            logger.error(
-                f"[Culler] Failed to list workspace terminal references: {e}"
-            )
+            logger.error("[Culler] Failed to list workspace terminal references: %s", e)
             return None
 
+    async def list_workspaces_async(self) -> list[dict[str, Any]]:
+        """list_workspaces for request handlers (worker thread, single-flight)."""
+        return await self._single_flight("workspaces", self.list_workspaces)
+
     def list_workspaces(self) -> list[dict[str, Any]]:
         """Return list of workspaces with their metadata."""
         result: list[dict[str, Any]] = []
@@ -348,7 +677,7 @@ class ResourceCuller:
             return result
 
         try:
-            for ws in ws_mgr.list_workspaces():
+            for ws in self._list_workspaces_cached(ws_mgr):
                 metadata = ws.get("metadata", {})
                 result.append({
                     "id": metadata.get("id", "unknown"),
@@ -356,51 +685,182 @@ class ResourceCuller:
                     "created": metadata.get("created"),
                 })
         except Exception as e:
-            logger.error(f"[Culler] Failed to list workspaces: {e}")
+            logger.error("[Culler] Failed to list workspaces: %s", e)
 
         return result
 
-    async def _cull_idle_resources(self) -> None:
-        """Main culling routine called by periodic callback."""
-        kernels_culled: list[str] = []
-        terminals_culled: list[str] = []
-        workspaces_culled: list[str] = []
+    @staticmethod
+    def _to_epoch(value: datetime | str) -> float:
+        """Epoch seconds of an activity timestamp (ISO string or datetime).
 
-        if self._kernel_cull_enabled:
-            kernels_culled = await self._cull_kernels()
+        Naive values are UTC, as jupyter_server records them.
+        """
+        if isinstance(value, str):
+            value = _parse_iso_string(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=_UTC)
+        return value.timestamp()
 
-        # Workspaces before terminals: a culled workspace releases the
-        # terminals it referenced, so the cascade lands in the same pass
-        if self._workspace_cull_enabled:
-            workspaces_culled = self._cull_workspaces()
+    def _activity_epoch(
+        self,
+        cache: dict[str, tuple[Any, float]],
+        seen: dict[str, tuple[Any, float]],
+        key: str,
+        value: datetime | str,
+    ) -> float:
+        """Epoch seconds of ``value``, parsed only when it changed since the
+        last sweep; records the entry in ``seen`` for the next sweep."""
+        cached = cache.get(key)
+        if cached is not None and cached[0] == value:
+            epoch = cached[1]
+        else:
+            epoch = self._to_epoch(value)
+        seen[key] = (value, epoch)
+        return epoch
 
-        if self._terminal_cull_enabled:
-            terminals_culled = await self._cull_terminals()
+    @staticmethod
+    def _fast_empty(mgr: Any, attr: str) -> bool:
+        """True only when ``mgr.<attr>`` is a dict registry known to be empty.
+
+        A missing attribute, a non-dict registry or any error counts as
+        non-empty, so an unfamiliar manager still gets the full sweep.
+        """
+        try:
+            registry = getattr(mgr, attr, None)
+            return isinstance(registry, dict) and not registry
+        except Exception:
+            return False
+
+    async def _cull_idle_resources(self) -> None:
+        """Main culling routine, run once per scheduled sweep."""
+        if self._sweep_lock.locked():
+            logger.warning("[Culler] Previous sweep or manual cull still running, skipping this sweep")
+            return
+        async with self._sweep_lock:
+            await self._sweep()
+
+    # Resource names listed per kind in the sweep summary log line
+    _SUMMARY_NAMES_MAX = 5
+
+    async def _sweep(self) -> None:
+        """One culling pass over kernels, workspaces and terminals."""
+        self._next_expiry_seconds = None
+        # One reference time for every resource in the pass
+        now = time.time()
+
+        async def kernels() -> list[str]:
+            # An idle lab server usually has nothing to sweep; skip the listing
+            if self._kernel_cull_enabled and not self._fast_empty(
+                self.kernel_manager, "_kernels"
+            ):
+                return await self._cull_kernels(now)
+            return []
+
+        async def workspaces_then_terminals() -> tuple[list[str], list[str]]:
+            # Workspaces before terminals: a culled workspace releases the
+            # terminals it referenced, so the cascade lands in the same pass.
+            # Listing and deleting are file I/O, so they run on a worker thread
+            workspaces = (
+                await asyncio.to_thread(self._cull_workspaces, now)
+                if self._workspace_cull_enabled
+                else []
+            )
+            terminals = await self._cull_terminals(now) if self._terminal_cull_enabled else []
+            return workspaces, terminals
+
+        # Kernels do not take part in the workspace -> terminal cascade, so the
+        # two chains run together and their shutdowns overlap
+        kernels_culled, (workspaces_culled, terminals_culled) = await asyncio.gather(
+            kernels(), workspaces_then_terminals()
+        )
 
         # Store result for notification polling
         if kernels_culled or terminals_culled or workspaces_culled:
-            self._last_cull_result = {
+            # One line per sweep rather than one per resource; names truncated
+            # so a large burst cannot produce an unbounded message
+            n = self._SUMMARY_NAMES_MAX
+            logger.info(
+                "[Culler] Swept: kernels=%d %s, terminals=%d %s, workspaces=%d %s",
+                len(kernels_culled),
+                kernels_culled[:n],
+                len(terminals_culled),
+                terminals_culled[:n],
+                len(workspaces_culled),
+                workspaces_culled[:n],
+            )
+            self._pending_results.append({
                 "kernels_culled": kernels_culled,
                 "terminals_culled": terminals_culled,
                 "workspaces_culled": workspaces_culled,
-            }
-            self._result_consumed = False
+            })
+            self._result_event.set()
+
+    @staticmethod
+    async def _shutdown_all(
+        kind: str, names: list[str], shutdown: Callable[[str], Awaitable[Any]]
+    ) -> list[str]:
+        """Shut the named resources down concurrently; return those that went.
+
+        Each failure is logged and leaves the others unaffected.
+        """
+        outcomes = await asyncio.gather(
+            *(shutdown(n) for n in names), return_exceptions=True
+        )
+        culled: list[str] = []
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("[Culler] Failed to cull %s %s: %s", kind, name, outcome)
+            else:
+                culled.append(name)
+        return culled
 
-    async def _cull_kernels(self) -> list[str]:
+    def _is_expired(
+        self, kind: str, name: str, idle_seconds: float, timeout_minutes: int
+    ) -> bool:
+        """Shared verdict for every resource kind.
+
+        Past the timeout: return True (the sweep logs one summary line for
+        everything culled). Otherwise record the time left, which paces the
+        next sweep.
+        """
+        timeout_seconds = timeout_minutes * 60
+        if idle_seconds > timeout_seconds:
+            logger.debug(
+                "[Culler] CULLING %s %s - idle %.1f minutes (threshold: %s)",
+                kind,
+                name,
+                idle_seconds / 60,
+                timeout_minutes,
+            )
+            return True
+        self._note_expiry(timeout_seconds - idle_seconds)
+        return False
+
+    async def _cull_kernels(self, now: float | None = None) -> list[str]:
         """Cull idle kernels exceeding timeout threshold."""
         culled: list[str] = []
-        now = datetime.now(timezone.utc)
-        timeout_seconds = self._kernel_cull_idle_timeout * 60
+        if now is None:
+            now = time.time()
+        timeout_minutes = self._kernel_cull_idle_timeout
+        kernel_mgr = self.kernel_manager
+        # Bound once: the loop below runs these for every kernel
+        get_kernel = kernel_mgr.get_kernel
+        activity_epoch = self._activity_epoch
+        is_expired = self._is_expired
 
         try:
-            kernel_ids = list(self.kernel_manager.list_kernel_ids())
+            kernel_ids = list(kernel_mgr.list_kernel_ids())
         except Exception as e:
-            logger.error(f"[Culler] Failed to list kernels: {e}")
+            logger.error("[Culler] Failed to list kernels: %s", e)
             return culled
 
+        epochs = self._activity_epochs["kernel"]
+        seen: dict[str, tuple[Any, float]] = {}
+        targets: list[str] = []
+
         for kernel_id in kernel_ids:
             try:
-                kernel = self.kernel_manager.get_kernel(kernel_id)
+                kernel = get_kernel(kernel_id)
                 if kernel is None:
                     continue
 
@@ -414,32 +874,22 @@ class ResourceCuller:
                 if last_activity is None:
                     continue
 
-                # Ensure timezone-aware comparison
-                if last_activity.tzinfo is None:
-                    last_activity = last_activity.replace(tzinfo=timezone.utc)
+                idle_seconds = now - activity_epoch(epochs, seen, kernel_id, last_activity)
 
-                idle_seconds = (now - last_activity).total_seconds()
-                idle_minutes = idle_seconds / 60
-
-                if idle_seconds > timeout_seconds:
-                    logger.info(
-                        f"[Culler] CULLING KERNEL {kernel_id} - idle {idle_minutes:.1f} minutes "
-                        f"(threshold: {self._kernel_cull_idle_timeout})"
-                    )
-                    await self.kernel_manager.shutdown_kernel(kernel_id)
-                    logger.info(f"[Culler] Kernel {kernel_id} culled successfully")
-                    culled.append(kernel_id)
+                if is_expired("KERNEL", kernel_id, idle_seconds, timeout_minutes):
+                    targets.append(kernel_id)
 
             except Exception as e:
-                logger.error(f"[Culler] Failed to cull kernel {kernel_id}: {e}")
+                logger.error("[Culler] Failed to cull kernel %s: %s", kernel_id, e)
 
-        return culled
+        self._activity_epochs["kernel"] = seen
+        return await self._shutdown_all(
+            "kernel", targets, kernel_mgr.shutdown_kernel
+        )
 
-    async def _cull_terminals(self) -> list[str]:
+    async def _cull_terminals(self, now: float | None = None) -> list[str]:
         """Cull idle terminals exceeding timeout threshold."""
         culled: list[str] = []
-        now = datetime.now(timezone.utc)
-        timeout_seconds = self._terminal_cull_idle_timeout * 60
 
         terminal_mgr = self.terminal_manager
         if terminal_mgr is None:
@@ -449,14 +899,27 @@ class ResourceCuller:
         try:
             terminals = terminal_mgr.list()
         except Exception as e:
-            logger.error(f"[Culler] Failed to list terminals: {e}")
+            logger.error("[Culler] Failed to list terminals: %s", e)
+            return culled
+
+        # No terminals: skip the workspace scan below (it reads every
+        # workspace file) and drop per-terminal state
+        if not terminals:
+            self._terminal_tab_last_seen.clear()
+            self._activity_epochs["terminal"] = {}
             return culled
 
+        if now is None:
+            now = time.time()
+        timeout_minutes = self._terminal_cull_idle_timeout
+
         # Terminals open in any not-yet-culled workspace are NEVER culled;
         # the workspace must be culled first, which releases them (cascade).
         # None means workspaces exist but could not be read - fail safe and
         # cull nothing rather than kill a possibly-referenced terminal.
-        ws_referenced = self._workspace_referenced_terminals()
+        # The scan reads every workspace file, so it runs on a worker thread
+        # to keep websocket traffic flowing during the sweep.
+        ws_referenced = await asyncio.to_thread(self._workspace_referenced_terminals, True)
         if ws_referenced is None:
             logger.warning(
                 "[Culler] Cannot verify workspace terminal references; "
@@ -469,6 +932,22 @@ class ResourceCuller:
         for gone in set(self._terminal_tab_last_seen) - current_names:
             del self._terminal_tab_last_seen[gone]
 
+        epochs = self._activity_epochs["terminal"]
+        seen: dict[str, tuple[Any, float]] = {}
+        targets: list[str] = []
+
+        # Resolve open tabs once per pass rather than re-unioning every
+        # client's report (and probing the pty registry) per terminal
+        disconnected_only = self._terminal_cull_disconnected_only
+        open_tabs = self._open_tab_terminals() if disconnected_only else frozenset()
+        # Skip-reason logging fires for most terminals on every sweep; resolve
+        # the level once so the loop pays nothing when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Bound once: the loop below runs these for every entry
+        tab_last_seen_by_name = self._terminal_tab_last_seen
+        activity_epoch = self._activity_epoch
+        is_expired = self._is_expired
+
         for terminal in terminals:
             try:
                 name = terminal.get("name")
@@ -481,59 +960,44 @@ class ResourceCuller:
                 # anchor - the terminal would then be culled within one check
                 # interval of its reference disappearing (tab closed, workspace
                 # culled) instead of getting the documented full-timeout grace
-                if self._terminal_cull_disconnected_only:
-                    if self._terminal_has_active_tab(name):
-                        self._terminal_tab_last_seen[name] = now
-                        logger.debug(
-                            f"[Culler] Skipping terminal {name} - has active tab"
-                        )
-                        continue
+                if disconnected_only and name in open_tabs:
+                    tab_last_seen_by_name[name] = now
+                    if debug:
+                        logger.debug("[Culler] Skipping terminal %s - has active tab", name)
+                    continue
 
                 if name in ws_referenced:
-                    logger.debug(
-                        f"[Culler] Skipping terminal {name} - open in a workspace"
-                    )
+                    if debug:
+                        logger.debug(
+                            "[Culler] Skipping terminal %s - open in a workspace", name
+                        )
                     continue
 
                 last_activity = terminal.get("last_activity")
                 if last_activity is None:
                     continue
 
-                # Parse datetime if string
-                if isinstance(last_activity, str):
-                    last_activity = datetime.fromisoformat(
-                        last_activity.replace("Z", "+00:00")
-                    )
-
-                # Ensure timezone-aware comparison
-                if last_activity.tzinfo is None:
-                    last_activity = last_activity.replace(tzinfo=timezone.utc)
+                last_epoch = activity_epoch(epochs, seen, name, last_activity)
 
                 # A terminal whose tab closed or disconnected becomes eligible one
                 # full idle timeout after that moment (the documented semantics),
                 # so a transient websocket loss - network blip, exhausted frontend
                 # reconnect attempts, sleep/wake - cannot cull it on the next check
-                if self._terminal_cull_disconnected_only:
-                    tab_last_seen = self._terminal_tab_last_seen.get(name)
-                    if tab_last_seen is not None and tab_last_seen > last_activity:
-                        last_activity = tab_last_seen
+                if disconnected_only:
+                    tab_last_seen = tab_last_seen_by_name.get(name)
+                    if tab_last_seen is not None and tab_last_seen > last_epoch:
+                        last_epoch = tab_last_seen
 
-                idle_seconds = (now - last_activity).total_seconds()
-                idle_minutes = idle_seconds / 60
+                idle_seconds = now - last_epoch
 
-                if idle_seconds > timeout_seconds:
-                    logger.info(
-                        f"[Culler] CULLING TERMINAL {name} - idle {idle_minutes:.1f} minutes "
-                        f"(threshold: {self._terminal_cull_idle_timeout})"
-                    )
-                    await terminal_mgr.terminate(name)
-                    logger.info(f"[Culler] Terminal {name} culled successfully")
-                    culled.append(name)
+                if is_expired("TERMINAL", name, idle_seconds, timeout_minutes):
+                    targets.append(name)
 
             except Exception as e:
-                logger.error(f"[Culler] Failed to cull terminal {name}: {e}")
+                logger.error("[Culler] Failed to cull terminal %s: %s", name, e)
 
-        return culled
+        self._activity_epochs["terminal"] = seen
+        return await self._shutdown_all("terminal", targets, terminal_mgr.terminate)
 
     @staticmethod
     def _is_cullable_workspace(workspace_id: str) -> bool:
@@ -544,23 +1008,54 @@ class ResourceCuller:
         """
         return workspace_id.lstrip("/").startswith("auto-")
 
-    def _cull_workspaces(self) -> list[str]:
+    def _cull_workspaces(self, now: float | None = None) -> list[str]:
         """Cull idle workspaces exceeding timeout threshold."""
         culled: list[str] = []
-        now = datetime.now(timezone.utc)
-        timeout_seconds = self._workspace_cull_idle_timeout * 60
+        if now is None:
+            now = time.time()
+        timeout_minutes = self._workspace_cull_idle_timeout
 
         ws_mgr = self.workspace_manager
         if ws_mgr is None:
             logger.warning("[Culler] Workspace manager not available")
             return culled
 
+        # A saved workspace only gets newer, so while the directory holds the
+        # same files nothing can expire before the oldest one the last pass
+        # saw. Until then skip the listing - with the default 7-day timeout,
+        # that is almost every sweep. A file that appeared since (restored,
+        # copied in with its old mtime) changes the entry names and forces a
+        # re-scan; settings changes reset the bound (see update_settings).
+        entries = self._workspace_dir_entries(ws_mgr)
+        oldest = self._workspace_oldest_epoch
+        if (
+            oldest is not None
+            and entries is not None
+            and oldest[0] is ws_mgr
+            and oldest[2] == entries
+        ):
+            remaining = oldest[1] + timeout_minutes * 60 - now
+            if remaining > 0:
+                self._note_expiry(remaining)
+                return culled
+
         try:
-            workspaces = list(ws_mgr.list_workspaces())
+            workspaces = self._list_workspaces_cached(ws_mgr, fresh=True)
         except Exception as e:
-            logger.error(f"[Culler] Failed to list workspaces: {e}")
+            logger.error("[Culler] Failed to list workspaces: %s", e)
             return culled
 
+        epochs = self._activity_epochs["workspace"]
+        seen: dict[str, tuple[Any, float]] = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Culled workspaces count too: the next pass then re-lists once,
+        # and one whose delete failed is retried
+        oldest_epoch = now
+        # Bound once: the loop below runs these for every entry
+        is_cullable = self._is_cullable_workspace
+        activity_epoch = self._activity_epoch
+        is_expired = self._is_expired
+
         for workspace in workspaces:
             try:
                 metadata = workspace.get("metadata", {})
@@ -569,41 +1064,61 @@ class ResourceCuller:
                     continue
 
                 # Only auto-generated workspaces are eligible; named and default layouts are protected
-                if not self._is_cullable_workspace(workspace_id):
-                    logger.debug(f"[Culler] Skipping protected workspace {workspace_id}")
+                if not is_cullable(workspace_id):
+                    if debug:
+                        logger.debug("[Culler] Skipping protected workspace %s", workspace_id)
                     continue
 
                 last_modified = metadata.get("last_modified")
                 if last_modified is None:
                     continue
 
-                # Parse datetime if string
-                if isinstance(last_modified, str):
-                    last_modified = datetime.fromisoformat(
-                        last_modified.replace("Z", "+00:00")
-                    )
-
-                # Ensure timezone-aware comparison
-                if last_modified.tzinfo is None:
-                    last_modified = last_modified.replace(tzinfo=timezone.utc)
+                epoch = activity_epoch(epochs, seen, workspace_id, last_modified)
+                if epoch < oldest_epoch:
+                    oldest_epoch = epoch
+                idle_seconds = now - epoch
 
-                idle_seconds = (now - last_modified).total_seconds()
-                idle_minutes = idle_seconds / 60
-
-                if idle_seconds > timeout_seconds:
-                    logger.info(
-                        f"[Culler] CULLING WORKSPACE {workspace_id} - idle {idle_minutes:.1f} minutes "
-                        f"(threshold: {self._workspace_cull_idle_timeout})"
-                    )
+                if is_expired("WORKSPACE", workspace_id, idle_seconds, timeout_minutes):
+                    self._ws_cache = None
                     ws_mgr.delete(workspace_id)
-                    logger.info(f"[Culler] Workspace {workspace_id} culled successfully")
                     culled.append(workspace_id)
 
             except Exception as e:
-                logger.error(f"[Culler] Failed to cull workspace {workspace_id}: {e}")
+                logger.error("[Culler] Failed to cull workspace %s: %s", workspace_id, e)
 
+        self._activity_epochs["workspace"] = seen
+        # Names read before the listing: a file added meanwhile (or deleted
+        # above) forces one more scan rather than hiding behind the bound
+        self._workspace_oldest_epoch = (
+            None if entries is None else (ws_mgr, oldest_epoch, entries)
+        )
         return culled
 
+    @staticmethod
+    def _workspace_dir_entries(ws_mgr: Any) -> frozenset[str] | None:
+        """Names in the manager's workspaces directory (one readdir, no file
+        reads); None when they cannot be read, which disables the skip."""
+        directory = getattr(ws_mgr, "workspaces_dir", None)
+        if not isinstance(directory, (str, os.PathLike)):
+            return None
+        try:
+            return frozenset(os.listdir(directory))
+        except OSError:
+            return None
+
+    async def cull_workspaces_with_timeout_async(
+        self, timeout_minutes: int, dry_run: bool = False
+    ) -> list[dict[str, Any]]:
+        """cull_workspaces_with_timeout for request handlers.
+
+        Runs on a worker thread so the file I/O does not block the IOLoop,
+        and under the sweep lock so it never races a sweep's own deletes.
+        """
+        async with self._sweep_lock:
+            return await asyncio.to_thread(
+                self.cull_workspaces_with_timeout, timeout_minutes, dry_run
+            )
+
     def cull_workspaces_with_timeout(
         self, timeout_minutes: int, dry_run: bool = False
     ) -> list[dict[str, Any]]:
@@ -617,7 +1132,7 @@ class ResourceCuller:
             List of workspace dicts with id, idle_time, and action
         """
         result: list[dict[str, Any]] = []
-        now = datetime.now(timezone.utc)
+        now = time.time()
         timeout_seconds = timeout_minutes * 60
 
         ws_mgr = self.workspace_manager
@@ -626,11 +1141,14 @@ class ResourceCuller:
             return result
 
         try:
-            workspaces = list(ws_mgr.list_workspaces())
+            workspaces = self._list_workspaces_cached(ws_mgr, fresh=True)
         except Exception as e:
-            logger.error(f"[Culler] Failed to list workspaces: {e}")
+            logger.error("[Culler] Failed to list workspaces: %s", e)
             return result
 
+        epochs = self._activity_epochs["workspace"]
+        scratch: dict[str, tuple[Any, float]] = {}
+
         for workspace in workspaces:
             try:
                 metadata = workspace.get("metadata", {})
@@ -646,55 +1164,34 @@ class ResourceCuller:
                 if last_modified is None:
                     continue
 
-                # Parse datetime if string
-                if isinstance(last_modified, str):
-                    last_modified = datetime.fromisoformat(
-                        last_modified.replace("Z", "+00:00")
-                    )
-
-                # Ensure timezone-aware comparison
-                if last_modified.tzinfo is None:
-                    last_modified = last_modified.replace(tzinfo=timezone.utc)
-
-                idle_seconds = (now - last_modified).total_seconds()
-                idle_minutes = idle_seconds / 60
+                # Reuse the sweep's parsed timestamps; only this call's
+                # scratch record is thrown away, the sweep's cache is untouched
+                idle_seconds = now - self._activity_epoch(
+                    epochs, scratch, workspace_id, last_modified
+                )
 
                 if idle_seconds > timeout_seconds:
                     if dry_run:
-                        # Format idle time for display
-                        if idle_seconds < 3600:
-                            idle_time = f"{idle_minutes:.1f}m"
-                        elif idle_seconds < 86400:
-                            idle_time = f"{idle_seconds / 3600:.1f}h"
-                        else:
-                            idle_time = f"{idle_seconds / 86400:.1f}d"
-                        result.append({
-                            "id": workspace_id,
-                            "idle_time": idle_time,
-                            "action": "would_cull",
-                        })
+                        action = "would_cull"
                     else:
                         logger.info(
-                            f"[Culler] CLI CULLING WORKSPACE {workspace_id} - "
-                            f"idle {idle_minutes:.1f} minutes (threshold: {timeout_minutes})"
+                            "[Culler] CLI CULLING WORKSPACE %s - idle %.1f minutes (threshold: %s)",
+                            workspace_id,
+                            idle_seconds / 60,
+                            timeout_minutes,
                         )
+                        self._ws_cache = None
                         ws_mgr.delete(workspace_id)
-                        logger.info(f"[Culler] Workspace {workspace_id} culled successfully")
-                        # Format idle time for display
-                        if idle_seconds < 3600:
-                            idle_time = f"{idle_minutes:.1f}m"
-                        elif idle_seconds < 86400:
-                            idle_time = f"{idle_seconds / 3600:.1f}h"
-                        else:
-                            idle_time = f"{idle_seconds / 86400:.1f}d"
-                        result.append({
-                            "id": workspace_id,
-                            "idle_time": idle_time,
-                            "action": "culled",
-                        })
+                        logger.info("[Culler] Workspace %s culled successfully", workspace_id)
+                        action = "culled"
+                    result.append({
+                        "id": workspace_id,
+                        "idle_time": _fmt_idle(idle_seconds),
+                        "action": action,
+                    })
 
             except Exception as e:
-                logger.error(f"[Culler] Failed to cull workspace {workspace_id}: {e}")
+                logger.error("[Culler] Failed to cull workspace %s: %s", workspace_id, e)
                 result.append({
                     "id": workspace_id,
                     "idle_time": "unknown",
@@ -1,18 +1,38 @@
 """Route handlers for the resource culler extension."""
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import tornado
 from jupyter_server.base.handlers import APIHandler
 from jupyter_server.utils import url_path_join
 
+try:
+    import orjson
+except ImportError:  # optional speedup (the "fast" extra); stdlib json otherwise
+    orjson = None
+
 if TYPE_CHECKING:
     from .culler import ResourceCuller
 
+
+def _dumps(obj: Any) -> bytes | str:
+    """Serialize a response body, with orjson when it is installed.
+
+    The frontend polls the status, connection and workspace endpoints, so
+    their bodies are encoded on every poll.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
 # Global reference to culler instance - set by __init__.py
 _culler: "ResourceCuller | None" = None
 
+# Encoded status body, reused while the culler hands back the same status dict
+_status_body: "tuple[dict[str, Any], bytes | str] | None" = None
+
 
 def set_culler(culler: "ResourceCuller") -> None:
     """Set the global culler instance."""
@@ -33,26 +53,26 @@ class SettingsHandler(APIHandler):
         """Update culler settings from frontend."""
         if _culler is None:
             self.set_status(503)
-            self.finish(json.dumps({"error": "Culler not initialized"}))
+            self.finish(_dumps({"error": "Culler not initialized"}))
             return
 
         try:
             settings = json.loads(self.request.body)
             if not isinstance(settings, dict):
                 self.set_status(400)
-                self.finish(json.dumps({"error": "Body must be a JSON object"}))
+                self.finish(_dumps({"error": "Body must be a JSON object"}))
                 return
             _culler.update_settings(settings)
-            self.finish(json.dumps({"status": "ok"}))
+            self.finish(_dumps({"status": "ok"}))
         except (json.JSONDecodeError, UnicodeDecodeError, RecursionError):
             self.set_status(400)
-            self.finish(json.dumps({"error": "Invalid JSON"}))
+            self.finish(_dumps({"error": "Invalid JSON"}))
         except ValueError as e:
             self.set_status(400)
-            self.finish(json.dumps({"error": str(e)}))
+            self.finish(_dumps({"error": str(e)}))
         except Exception as e:
             self.set_status(500)
-            self.finish(json.dumps({"error": str(e)}))
+            self.finish(_dumps({"error": str(e)}))
 
 
 class StatusHandler(APIHandler):
@@ -63,21 +83,48 @@ class StatusHandler(APIHandler):
         """Return culler status and settings."""
         if _culler is None:
             self.set_status(503)
-            self.finish(json.dumps({"error": "Culler not initialized"}))
+            self.finish(_dumps({"error": "Culler not initialized"}))
             return
 
-        self.finish(json.dumps(_culler.get_status()))
+        global _status_body
+        status = _culler.get_status()
+        if _status_body is None or _status_body[0] is not status:
+            _status_body = (status, _dumps(status))
+        self.finish(_status_body[1])
 
 
 class CullResultHandler(APIHandler):
     """Handler for returning last culling summary."""
 
+    # Upper bound for ?wait=, kept under common proxy idle timeouts
+    MAX_WAIT_SECONDS = 55
+
     @tornado.web.authenticated
-    def get(self) -> None:
-        """Return last culling result for notification polling."""
+    async def get(self) -> None:
+        """Return last culling result for notification polling.
+
+        With ``?wait=<seconds>`` the request long-polls: it is answered as
+        soon as a sweep culls something, or with the empty result once the
+        wait (capped at MAX_WAIT_SECONDS) runs out.
+        """
+        wait = self.get_argument("wait", None)
+        if wait is not None:
+            try:
+                wait_seconds = float(wait)
+            except ValueError:
+                wait_seconds = -1.0
+            if not 0 <= wait_seconds <= self.MAX_WAIT_SECONDS:
+                self.set_status(400)
+                self.finish(
+                    _dumps(
+                        {"error": f"wait must be a number of seconds in [0, {self.MAX_WAIT_SECONDS}]"}
+                    )
+                )
+                return
+
         if _culler is None:
             self.finish(
-                json.dumps(
+                _dumps(
                     {
                         "kernels_culled": [],
                         "terminals_culled": [],
@@ -87,20 +134,24 @@ class CullResultHandler(APIHandler):
             )
             return
 
-        self.finish(json.dumps(_culler.get_last_cull_result()))
+        if wait is None:
+            result = _culler.get_last_cull_result()
+        else:
+            result = await _culler.wait_for_cull_result(wait_seconds)
+        self.finish(_dumps(result))
 
 
 class TerminalsConnectionHandler(APIHandler):
     """Handler for returning terminal connection status."""
 
     @tornado.web.authenticated
-    def get(self) -> None:
+    async def get(self) -> None:
         """Return connection status for all terminals."""
         if _culler is None:
-            self.finish(json.dumps({}))
+            self.finish(_dumps({}))
             return
 
-        self.finish(json.dumps(_culler.get_terminals_connection_status()))
+        self.finish(_dumps(await _culler.get_terminals_connection_status_async()))
 
 
 class ActiveTerminalsHandler(APIHandler):
@@ -111,13 +162,13 @@ class ActiveTerminalsHandler(APIHandler):
         """Update active terminals list."""
         if _culler is None:
             self.set_status(503)
-            self.finish(json.dumps({"error": "Culler not initialized"}))
+            self.finish(_dumps({"error": "Culler not initialized"}))
             return
         try:
             data = json.loads(self.request.body)
             if not isinstance(data, dict):
                 self.set_status(400)
-                self.finish(json.dumps({"error": "Body must be a JSON object"}))
+                self.finish(_dumps({"error": "Body must be a JSON object"}))
                 return
             terminals = data.get("terminals", [])
             client_id = data.get("clientId", "default")
@@ -128,7 +179,7 @@ class ActiveTerminalsHandler(APIHandler):
             ):
                 self.set_status(400)
                 self.finish(
-                    json.dumps(
+                    _dumps(
                         {"error": "terminals must be a list of strings, clientId a string"}
                     )
                 )
@@ -136,44 +187,44 @@ class ActiveTerminalsHandler(APIHandler):
             _culler.set_active_terminals(
                 terminals, client_id, data.get("intervalMinutes")
             )
-            self.finish(json.dumps({"status": "ok"}))
+            self.finish(_dumps({"status": "ok"}))
         except (json.JSONDecodeError, UnicodeDecodeError, RecursionError):
             self.set_status(400)
-            self.finish(json.dumps({"error": "Invalid JSON"}))
+            self.finish(_dumps({"error": "Invalid JSON"}))
         except Exception as e:
             self.set_status(500)
-            self.finish(json.dumps({"error": str(e)}))
+            self.finish(_dumps({"error": str(e)}))
 
 
 class WorkspacesHandler(APIHandler):
     """Handler for listing workspaces."""
 
     @tornado.web.authenticated
-    def get(self) -> None:
+    async def get(self) -> None:
         """Return list of workspaces with metadata."""
         if _culler is None:
-            self.finish(json.dumps([]))
+            self.finish(_dumps([]))
             return
 
-        self.finish(json.dumps(_culler.list_workspaces()))
+        self.finish(_dumps(await _culler.list_workspaces_async()))
 
 
 class CullWorkspacesHandler(APIHandler):
     """Handler for culling workspaces via CLI."""
 
     @tornado.web.authenticated
-    def post(self) -> None:
+    async def post(self) -> None:
         """Cull workspaces based on timeout parameter."""
         if _culler is None:
             self.set_status(503)
-            self.finish(json.dumps({"error": "Culler not initialized"}))
+            self.finish(_dumps({"error": "Culler not initialized"}))
             return
 
         try:
             data = json.loads(self.request.body)
             if not isinstance(data, dict):
                 self.set_status(400)
-                self.finish(json.dumps({"error": "Body must be a JSON object"}))
+                self.finish(_dumps({"error": "Body must be a JSON object"}))
                 return
             timeout_minutes = data.get("timeout", 10080)  # default 7 days
             dry_run = data.get("dry_run", False)
@@ -186,19 +237,21 @@ class CullWorkspacesHandler(APIHandler):
             ):
                 self.set_status(400)
                 self.finish(
-                    json.dumps(
+                    _dumps(
                         {"error": "timeout must be an integer >= 1, dry_run a boolean"}
                     )
                 )
                 return
-            culled = _culler.cull_workspaces_with_timeout(timeout_minutes, dry_run)
-            self.finish(json.dumps({"workspaces_culled": culled}))
+            culled = await _culler.cull_workspaces_with_timeout_async(
+                timeout_minutes, dry_run
+            )
+            self.finish(_dumps({"workspaces_culled": culled}))
         except (json.JSONDecodeError, UnicodeDecodeError, RecursionError):
             self.set_status(400)
-            self.finish(json.dumps({"error": "Invalid JSON"}))
+            self.finish(_dumps({"error": "Invalid JSON"}))
         except Exception as e:
             self.set_status(500)
-            self.finish(json.dumps({"error": str(e)}))
+            self.finish(_dumps({"error": str(e)}))
 
 
 def setup_route_handlers(web_app: tornado.web.Application) -> None:
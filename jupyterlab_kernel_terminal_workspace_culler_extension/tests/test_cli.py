@@ -1,15 +1,33 @@
 """Unit tests for the CLI culling logic."""
 
 import argparse
+import json
+import subprocess
+import sys
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
+import pytest
+
+from jupyterlab_kernel_terminal_workspace_culler_extension import cli
 from jupyterlab_kernel_terminal_workspace_culler_extension.cli import (
+    JupyterClient,
     cmd_cull,
+    cmd_list,
+    format_idle_seconds,
+    format_idle_time,
+    get_jupyter_server_info,
+    main,
     resolve_server_url_and_token,
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_server_cache(tmp_path, monkeypatch):
+    """Never read or write the user's real server-detection cache."""
+    monkeypatch.setattr(cli, "_SERVER_CACHE", tmp_path / "server.json")
+
+
 def _args(**overrides) -> argparse.Namespace:
     defaults = {
         "json": False,
@@ -124,3 +142,328 @@ class TestServerResolution:
         url, token = resolve_server_url_and_token(self._ns())
         assert url == "http://env:8888/"
         assert token == "envtoken"
+
+    def test_empty_token_var_is_skipped(self, monkeypatch):
+        monkeypatch.setenv("JUPYTERHUB_API_TOKEN", "")
+        monkeypatch.setenv("JPY_API_TOKEN", "legacy")
+        monkeypatch.setenv("JUPYTER_TOKEN", "envtoken")
+        _url, token = resolve_server_url_and_token(self._ns(server_url="http://flag:8888/"))
+        assert token == "legacy"
+
+
+class TestHubDetection:
+    """Inside JupyterHub the environment is authoritative; no subprocess."""
+
+    @pytest.fixture(autouse=True)
+    def _no_subprocess(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("jupyter server list must not run under a hub")
+
+        monkeypatch.setattr(
+            "jupyterlab_kernel_terminal_workspace_culler_extension.cli.subprocess.run",
+            fail,
+        )
+        monkeypatch.setenv("JUPYTERHUB_SERVICE_PREFIX", "/user/alice/")
+        monkeypatch.setenv("JUPYTERHUB_API_TOKEN", "hubtoken")
+        monkeypatch.delenv("JUPYTER_PORT", raising=False)
+        monkeypatch.delenv("JUPYTERHUB_SERVICE_URL", raising=False)
+
+    def test_default_port(self):
+        assert get_jupyter_server_info() == (
+            "http://127.0.0.1:8888/user/alice",
+            "hubtoken",
+        )
+
+    def test_port_from_service_url(self, monkeypatch):
+        monkeypatch.setenv("JUPYTERHUB_SERVICE_URL", "http://0.0.0.0:9999/user/alice/")
+        url, _token = get_jupyter_server_info()
+        assert url == "http://127.0.0.1:9999/user/alice"
+
+    def test_jupyter_port_wins(self, monkeypatch):
+        monkeypatch.setenv("JUPYTERHUB_SERVICE_URL", "http://0.0.0.0:9999/user/alice/")
+        monkeypatch.setenv("JUPYTER_PORT", "7777")
+        url, _token = get_jupyter_server_info()
+        assert url == "http://127.0.0.1:7777/user/alice"
+
+
+class TestServerCache:
+    """`jupyter server list` runs once per TTL, not once per invocation."""
+
+    @pytest.fixture(autouse=True)
+    def _standalone(self, monkeypatch):
+        for var in ("JUPYTERHUB_SERVICE_PREFIX", "JUPYTERHUB_API_TOKEN", "JPY_API_TOKEN", "JUPYTER_TOKEN"):
+            monkeypatch.delenv(var, raising=False)
+        self.calls = 0
+
+        def fake_run(*args, **kwargs):
+            self.calls += 1
+            line = json.dumps({"port": 8890, "base_url": "/lab/", "token": "srvtoken"})
+            return subprocess.CompletedProcess(args, 0, stdout=line + "\n")
+
+        monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    def test_second_lookup_served_from_cache(self):
+        expected = ("http://127.0.0.1:8890/lab", "srvtoken")
+        assert get_jupyter_server_info() == expected
+        assert get_jupyter_server_info() == expected
+        assert self.calls == 1
+
+    def test_stale_cache_redetects(self):
+        get_jupyter_server_info()
+        stale = cli.time.time() - cli._SERVER_CACHE_TTL - 1
+        cli.os.utime(cli._SERVER_CACHE, (stale, stale))
+        get_jupyter_server_info()
+        assert self.calls == 2
+
+    def test_invalidate(self):
+        get_jupyter_server_info()
+        cli.invalidate_server_cache()
+        get_jupyter_server_info()
+        assert self.calls == 2
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            {"url": None, "servers": 1},
+            {"url": "http://127.0.0.1:8890/lab", "servers": "2"},
+            {"url": "http://127.0.0.1:8890/lab", "token": 5},
+            ["http://127.0.0.1:8890/lab"],
+        ],
+        ids=["null_url", "string_servers", "int_token", "not_a_dict"],
+    )
+    def test_malformed_cache_redetects(self, entry):
+        cli._SERVER_CACHE.write_text(json.dumps(entry))
+        assert get_jupyter_server_info() == ("http://127.0.0.1:8890/lab", "srvtoken")
+        assert self.calls == 1
+
+    def test_failed_write_leaves_no_temp_file(self):
+        cli._write_server_cache({"url": "http://127.0.0.1:8890/", "token": object()})
+        assert list(cli._SERVER_CACHE.parent.iterdir()) == []
+
+    def test_env_token_still_wins_over_cached_token(self, monkeypatch):
+        get_jupyter_server_info()
+        monkeypatch.setenv("JUPYTER_TOKEN", "envtoken")
+        assert get_jupyter_server_info()[1] == "envtoken"
+
+
+class TestJupyterClientSession:
+    """All requests go through one pooled session carrying the auth header."""
+
+    def test_session_carries_token(self):
+        client = JupyterClient("http://localhost:8888", "secret")
+        assert client._session.headers["Authorization"] == "token secret"
+
+    def test_pool_fits_every_cull_worker(self):
+        from jupyterlab_kernel_terminal_workspace_culler_extension.cli import (
+            _MAX_CULL_WORKERS,
+        )
+
+        adapter = JupyterClient("http://localhost:8888")._session.get_adapter("http://x")
+        assert adapter._pool_maxsize >= _MAX_CULL_WORKERS
+
+    def test_retries_only_gets_on_gateway_errors(self):
+        retry = JupyterClient("http://localhost:8888")._session.get_adapter("http://x").max_retries
+        assert retry.allowed_methods == frozenset({"GET"})
+        assert 503 not in retry.status_forcelist  # the extension's "not initialized"
+        assert retry.is_retry("GET", 502)
+        assert not retry.is_retry("DELETE", 502)
+
+    def test_negotiates_compressed_json(self):
+        headers = JupyterClient("http://localhost:8888")._session.headers
+        assert headers["Accept"] == "application/json"
+        assert "gzip" in headers["Accept-Encoding"]
+        assert headers["Connection"] == "keep-alive"
+
+    def test_no_token_no_auth_header(self):
+        client = JupyterClient("http://localhost:8888")
+        assert "Authorization" not in client._session.headers
+
+    def test_get_uses_session(self):
+        client = JupyterClient("http://localhost:8888", "secret")
+        client._session = MagicMock()
+        client._session.get.return_value.content = b"[]"
+        client._session.get.return_value.json.return_value = []
+
+        assert client._get("api/kernels") == []
+        client._session.get.assert_called_once_with(
+            "http://localhost:8888/api/kernels", timeout=10
+        )
+
+    def test_missing_extension_remembered(self):
+        """A 404 means the extension is not loaded; later probes skip the network."""
+        client = JupyterClient("http://localhost:8888")
+        client._session = MagicMock()
+        client._session.get.return_value.status_code = 404
+
+        assert client.get_culler_status() is None
+        # unavailable is "unknown" (None), never "all disconnected" ({})
+        assert client.get_terminals_connection() is None
+        assert client.list_workspaces() is None
+        assert client.cull_workspaces(60) is None
+        client._session.get.assert_called_once()
+        client._session.post.assert_not_called()
+
+    def test_transient_error_not_remembered(self):
+        client = JupyterClient("http://localhost:8888")
+        client._session = MagicMock()
+        client._session.get.return_value.status_code = 500
+        client._session.get.return_value.ok = False
+
+        assert client.get_culler_status() is None
+        assert client.get_terminals_connection() is None
+        assert client._session.get.call_count == 2
+
+    def test_url_keeps_base_path(self):
+        client = JupyterClient("http://127.0.0.1:8888/user/alice")
+        assert client._url("api/kernels") == "http://127.0.0.1:8888/user/alice/api/kernels"
+        assert client._url("/api/kernels") == "http://127.0.0.1:8888/user/alice/api/kernels"
+
+
+class TestCmdCullConcurrent:
+    """DELETEs run on a thread pool but results keep the listing order."""
+
+    @staticmethod
+    def _idle_kernel(kernel_id: str) -> dict:
+        return {
+            "id": kernel_id,
+            "execution_state": "idle",
+            "idle_seconds": 7200,
+        }
+
+    def test_results_keep_order_and_outcome(self, capsys):
+        client = _client([_idle_terminal("1", 120)], connection={"1": False})
+        client.list_kernels.return_value = [
+            self._idle_kernel("k1"),
+            self._idle_kernel("k2"),
+        ]
+        client.shutdown_kernel.side_effect = lambda kid: kid == "k1"
+
+        cmd_cull(client, _args(json=True))
+
+        results = json.loads(capsys.readouterr().out)
+        assert [(k["id"], k["action"]) for k in results["kernels_culled"]] == [
+            ("k1", "culled"),
+            ("k2", "failed"),
+        ]
+        assert results["terminals_culled"][0]["action"] == "culled"
+
+    def test_idle_time_built_only_for_culled_rows(self, capsys):
+        client = _client([], connection={})
+        client.list_kernels.return_value = [self._idle_kernel("k1")]
+
+        cmd_cull(client, _args(json=True))
+
+        client.list_kernels.assert_called_once_with(include_human=False)
+        results = json.loads(capsys.readouterr().out)
+        assert results["kernels_culled"][0]["idle_time"] == "2.0h"
+
+    def test_dry_run_makes_no_delete_calls(self, capsys):
+        client = _client([_idle_terminal("1", 120)], connection={"1": False})
+        client.list_kernels.return_value = [self._idle_kernel("k1")]
+
+        cmd_cull(client, _args(json=True, dry_run=True))
+
+        client.shutdown_kernel.assert_not_called()
+        client.terminate_terminal.assert_not_called()
+        results = json.loads(capsys.readouterr().out)
+        assert results["kernels_culled"][0]["action"] == "would_cull"
+
+
+class TestCmdList:
+    def test_json_output_merges_concurrent_fetches(self, capsys):
+        client = _client([_idle_terminal("1", 120)], connection={"1": True})
+        client.list_workspaces.return_value = []
+        client.get_culler_status.return_value = {"running": True, "settings": {}}
+
+        rc = cmd_list(client, _args(json=True))
+
+        output = json.loads(capsys.readouterr().out)
+        assert rc == 0
+        assert output["terminals"][0]["connected"] is True
+        assert output["culler"]["running"] is True
+        assert output["workspaces"] == []
+
+    def test_human_output_written_in_one_call(self, capsys):
+        client = _client([_idle_terminal("1", 120)], connection={"1": False})
+        client.list_workspaces.return_value = None
+        client.get_culler_status.return_value = None
+
+        rc = cmd_list(client, _args(json=False))
+
+        lines = capsys.readouterr().out.splitlines()
+        assert rc == 0
+        assert lines[0] == "CULLER SETTINGS"
+        assert "  (culler extension not available)" in lines
+        assert "  (culler extension unavailable)" in lines
+        assert any(line.startswith("  1 ") and "disconnected" in line for line in lines)
+
+
+class TestJsonOutput:
+    """--json output bytes do not depend on whether orjson is installed."""
+
+    def test_non_ascii_identical_with_and_without_orjson(self, monkeypatch):
+        pytest.importorskip("orjson")
+        payload = {
+            "workspaces": [{"id": "auto-café-日本", "idle_seconds": 1.5, "created": None}],
+            "culler": {"running": True},
+        }
+        with_orjson = cli._dumps(payload)
+        monkeypatch.setattr(cli, "orjson", None)
+
+        assert cli._dumps(payload) == with_orjson
+        assert "auto-café-日本" in with_orjson
+
+
+class TestIdleFormatting:
+    _NOW = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+    def test_explicit_now_is_used(self):
+        assert format_idle_seconds("2026-01-01T23:00:00Z", now=self._NOW) == 3600
+
+    def test_buckets(self):
+        assert format_idle_time(self._NOW - timedelta(seconds=30), self._NOW) == "30s"
+        assert format_idle_time(self._NOW - timedelta(minutes=90), self._NOW) == "1.5h"
+        assert format_idle_time(self._NOW - timedelta(days=3), self._NOW) == "3.0d"
+
+    def test_tenths_truncate(self):
+        # 119.9 minutes is 1.99h: the tenth is truncated, never rounded up to 2.0h
+        almost_two_hours = self._NOW - timedelta(minutes=119, seconds=54)
+        assert format_idle_time(almost_two_hours, self._NOW) == "1.9h"
+        assert format_idle_time(self._NOW - timedelta(seconds=59.9), self._NOW) == "59s"
+
+    def test_bucket_boundaries(self):
+        cases = {59: "59s", 60: "1.0m", 3599: "59.9m", 3600: "1.0h", 86399: "23.9h", 86400: "1.0d"}
+        for seconds, expected in cases.items():
+            assert format_idle_time(self._NOW - timedelta(seconds=seconds), self._NOW) == expected
+
+    def test_missing_activity(self):
+        assert format_idle_seconds(None) == -1
+        assert format_idle_time(None) == "unknown"
+
+
+class TestTimeoutValidation:
+    def test_non_positive_timeout_rejected(self, capsys):
+        for flag in ("--kernel-timeout", "--terminal-timeout", "--workspace-timeout"):
+            with pytest.raises(SystemExit) as exc_info:
+                main(["cull", flag, "0"])
+            assert exc_info.value.code == 2, flag
+        assert "at least 1 minute" in capsys.readouterr().err
+
+    def test_unknown_activity_never_culled(self, capsys):
+        unknown = {"name": "1", "last_activity": None, "idle_seconds": -1, "idle_time": "unknown"}
+        client = _client([unknown], connection={"1": False})
+
+        cmd_cull(client, _args(terminal_timeout=1))
+
+        client.terminate_terminal.assert_not_called()
+
+
+def test_no_command_does_not_import_requests():
+    """--help / no-command must not pay for importing requests."""
+    code = (
+        "import sys\n"
+        "from jupyterlab_kernel_terminal_workspace_culler_extension.cli import main\n"
+        "main([])\n"
+        "assert 'requests' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True, capture_output=True)
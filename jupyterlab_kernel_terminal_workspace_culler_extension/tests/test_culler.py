@@ -1,6 +1,9 @@
 """Unit tests for the resource culler."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,22 +11,42 @@ import pytest
 from jupyterlab_kernel_terminal_workspace_culler_extension.culler import ResourceCuller
 
 
+# Activity stamps for tests far from the default 60 min timeout, where the
+# drift of an import-time clock read cannot matter. Tests near a boundary
+# (stale reports, reschedule delays) read the live clock instead.
+_IDLE_TIME = datetime.now(timezone.utc) - timedelta(minutes=120)
+_RECENT_TIME = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+
+async def _resolved(*args, **kwargs):
+    """Awaitable no-op behind the manager shutdown mocks."""
+    return None
+
+
 @pytest.fixture
 def mock_server_app():
-    """Create a mock server app with kernel and terminal managers."""
-    app = MagicMock()
+    """Create a stub server app with mocked kernel and terminal managers.
+
+    The app itself is a plain namespace: the culler only reads the two
+    managers and ``extension_manager`` off it, so only the managers (whose
+    calls tests assert on) pay for MagicMock. The shutdown calls are plain
+    MagicMocks returning a coroutine: they record calls like AsyncMock at a
+    quarter of its construction cost. Tests asserting on awaits install a
+    real AsyncMock.
+    """
+    app = SimpleNamespace(extension_manager=None)
 
     # Mock kernel manager
     app.kernel_manager = MagicMock()
     app.kernel_manager.list_kernel_ids.return_value = []
     app.kernel_manager.get_kernel.return_value = None
-    app.kernel_manager.shutdown_kernel = AsyncMock()
+    app.kernel_manager.shutdown_kernel = MagicMock(side_effect=_resolved)
 
     # Mock terminal manager
     app.terminal_manager = MagicMock()
     app.terminal_manager.list.return_value = []
     app.terminal_manager.terminals = {}  # real dict: name -> PtyWithClients
-    app.terminal_manager.terminate = AsyncMock()
+    app.terminal_manager.terminate = MagicMock(side_effect=_resolved)
 
     return app
 
@@ -45,47 +68,36 @@ def culler(mock_server_app):
 class TestDefaultSettings:
     """Test default settings initialization."""
 
-    def test_default_kernel_settings(self, culler):
+    def test_default_settings(self, culler):
         settings = culler.get_settings()
         assert settings["kernelCullEnabled"] is True
         assert settings["kernelCullIdleTimeout"] == 60  # 1 hour
-
-    def test_default_terminal_settings(self, culler):
-        settings = culler.get_settings()
         assert settings["terminalCullEnabled"] is True
         assert settings["terminalCullIdleTimeout"] == 60  # 1 hour
         assert settings["terminalCullDisconnectedOnly"] is True
-
-    def test_default_workspace_settings(self, culler):
-        settings = culler.get_settings()
         assert settings["workspaceCullEnabled"] is True
         assert settings["workspaceCullIdleTimeout"] == 10080  # 7 days
-
-    def test_default_check_interval(self, culler):
-        settings = culler.get_settings()
         assert settings["cullCheckInterval"] == 5
 
 
 class TestUpdateSettings:
     """Test settings update functionality."""
 
-    def test_update_kernel_settings(self, culler):
-        culler.update_settings({"kernelCullEnabled": False, "kernelCullIdleTimeout": 120})
-        settings = culler.get_settings()
-        assert settings["kernelCullEnabled"] is False
-        assert settings["kernelCullIdleTimeout"] == 120
-
-    def test_update_terminal_settings(self, culler):
-        culler.update_settings({"terminalCullEnabled": False, "terminalCullIdleTimeout": 45})
-        settings = culler.get_settings()
-        assert settings["terminalCullEnabled"] is False
-        assert settings["terminalCullIdleTimeout"] == 45
-
-    def test_update_workspace_settings(self, culler):
-        culler.update_settings({"workspaceCullEnabled": False, "workspaceCullIdleTimeout": 1440})
+    @pytest.mark.parametrize(
+        "update",
+        [
+            {"kernelCullEnabled": False, "kernelCullIdleTimeout": 120},
+            {"terminalCullEnabled": False, "terminalCullIdleTimeout": 45},
+            {"workspaceCullEnabled": False, "workspaceCullIdleTimeout": 1440},
+        ],
+        ids=["kernel", "terminal", "workspace"],
+    )
+    def test_update_settings(self, culler, update):
+        culler.update_settings(update)
         settings = culler.get_settings()
-        assert settings["workspaceCullEnabled"] is False
-        assert settings["workspaceCullIdleTimeout"] == 1440
+        for key, value in update.items():
+            assert settings[key] == value
+            assert type(settings[key]) is type(value)
 
     def test_partial_update(self, culler):
         culler.update_settings({"kernelCullEnabled": False})
@@ -134,111 +146,155 @@ class TestUpdateSettings:
         culler.update_settings({"showNotifications": True, "bogus": 1})
         assert culler.get_settings()["kernelCullEnabled"] is True
 
+    def test_unchanged_settings_are_a_no_op(self, culler, caplog):
+        culler._running = True
+        with patch.object(culler, "stop") as stop, caplog.at_level("INFO"):
+            culler.update_settings(culler.get_settings())
+        stop.assert_not_called()
+        assert "Settings updated" not in caplog.text
 
-class TestCullIdleKernel:
-    """Test kernel culling functionality."""
+    @pytest.fixture
+    def short_debounce(self, culler):
+        """Shrink the restart debounce so the tests below wait ~50 ms, not ~0.6 s."""
+        culler._RESTART_DEBOUNCE_SECONDS = 0.01
 
     @pytest.mark.asyncio
-    async def test_cull_idle_kernel(self, culler, mock_server_app):
-        kernel_id = "test-kernel-123"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
-
-        mock_kernel = MagicMock()
-        mock_kernel.execution_state = "idle"
-        mock_kernel.last_activity = idle_time
+    async def test_interval_change_restarts_running_culler(self, culler, short_debounce):
+        culler._running = True
+        with patch.object(culler, "stop") as stop, patch.object(culler, "start") as start:
+            culler.update_settings({"cullCheckInterval": 7, "kernelCullIdleTimeout": 60})
+            stop.assert_not_called()  # debounced
+            await asyncio.sleep(culler._RESTART_DEBOUNCE_SECONDS + 0.04)
+        stop.assert_called_once()
+        start.assert_called_once()
 
-        mock_server_app.kernel_manager.list_kernel_ids.return_value = [kernel_id]
-        mock_server_app.kernel_manager.get_kernel.return_value = mock_kernel
+    @pytest.mark.asyncio
+    async def test_interval_change_burst_restarts_once(self, culler, short_debounce):
+        """A slider drag sends many updates; only the last restarts the timer."""
+        culler._running = True
+        with patch.object(culler, "stop") as stop, patch.object(culler, "start") as start:
+            for minutes in (6, 7, 8, 9):
+                culler.update_settings({"cullCheckInterval": minutes})
+            await asyncio.sleep(culler._RESTART_DEBOUNCE_SECONDS + 0.04)
+        stop.assert_called_once()
+        start.assert_called_once()
+        assert culler._cull_check_interval == 9
 
-        culled = await culler._cull_kernels()
 
-        assert kernel_id in culled
-        mock_server_app.kernel_manager.shutdown_kernel.assert_called_once_with(kernel_id)
+class TestCullIdleKernel:
+    """Test kernel culling functionality."""
 
-    @pytest.mark.asyncio
-    async def test_skip_busy_kernel(self, culler, mock_server_app):
-        kernel_id = "busy-kernel-123"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.mark.parametrize(
+        "state,last_activity,should_cull",
+        [
+            ("idle", _IDLE_TIME, True),
+            ("busy", _IDLE_TIME, False),
+            ("idle", _RECENT_TIME, False),
+        ],
+        ids=["idle", "busy", "recently_active"],
+    )
+    async def test_kernel_culling(
+        self, culler, mock_server_app, state, last_activity, should_cull
+    ):
+        kernel_id = "kernel-1"
 
         mock_kernel = MagicMock()
-        mock_kernel.execution_state = "busy"
-        mock_kernel.last_activity = idle_time
+        mock_kernel.execution_state = state
+        mock_kernel.last_activity = last_activity
 
         mock_server_app.kernel_manager.list_kernel_ids.return_value = [kernel_id]
         mock_server_app.kernel_manager.get_kernel.return_value = mock_kernel
 
         culled = await culler._cull_kernels()
 
-        assert kernel_id not in culled
-        mock_server_app.kernel_manager.shutdown_kernel.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_skip_active_kernel(self, culler, mock_server_app):
-        kernel_id = "active-kernel-123"
-        recent_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-
+        shutdown = mock_server_app.kernel_manager.shutdown_kernel
+        if should_cull:
+            assert culled == [kernel_id]
+            shutdown.assert_called_once_with(kernel_id)
+        else:
+            assert culled == []
+            shutdown.assert_not_called()
+
+    async def test_sweep_reference_time_is_used(self, culler, mock_server_app):
+        """A kernel active 5 min ago is expired against a sweep time 2h later."""
+        recent = _RECENT_TIME
         mock_kernel = MagicMock()
         mock_kernel.execution_state = "idle"
-        mock_kernel.last_activity = recent_time
-
-        mock_server_app.kernel_manager.list_kernel_ids.return_value = [kernel_id]
+        mock_kernel.last_activity = recent
+        mock_server_app.kernel_manager.list_kernel_ids.return_value = ["k1"]
         mock_server_app.kernel_manager.get_kernel.return_value = mock_kernel
 
-        culled = await culler._cull_kernels()
-
-        assert kernel_id not in culled
-        mock_server_app.kernel_manager.shutdown_kernel.assert_not_called()
+        culled = await culler._cull_kernels(now=(recent + timedelta(hours=2)).timestamp())
 
+        assert culled == ["k1"]
 
-class TestCullIdleTerminal:
-    """Test terminal culling functionality."""
+    async def test_shutdowns_overlap_and_failures_isolated(self, culler, mock_server_app):
+        mock_kernel = MagicMock()
+        mock_kernel.execution_state = "idle"
+        mock_kernel.last_activity = _IDLE_TIME
+        mock_server_app.kernel_manager.list_kernel_ids.return_value = ["k1", "k2", "k3"]
+        mock_server_app.kernel_manager.get_kernel.return_value = mock_kernel
 
-    @pytest.mark.asyncio
-    async def test_cull_idle_terminal(self, culler, mock_server_app):
-        terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        in_flight = 0
+        peak = 0
 
-        mock_server_app.terminal_manager.list.return_value = [
-            {"name": terminal_name, "last_activity": idle_time}
-        ]
+        async def shutdown(kernel_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if kernel_id == "k2":
+                raise RuntimeError("boom")
 
-        culled = await culler._cull_terminals()
+        mock_server_app.kernel_manager.shutdown_kernel = shutdown
 
-        assert terminal_name in culled
-        mock_server_app.terminal_manager.terminate.assert_called_once_with(terminal_name)
-
-    @pytest.mark.asyncio
-    async def test_skip_active_terminal(self, culler, mock_server_app):
-        terminal_name = "terminal-1"
-        recent_time = datetime.now(timezone.utc) - timedelta(minutes=5)
+        culled = await culler._cull_kernels()
 
-        mock_server_app.terminal_manager.list.return_value = [
-            {"name": terminal_name, "last_activity": recent_time}
-        ]
+        assert culled == ["k1", "k3"]
+        assert peak == 3
 
-        culled = await culler._cull_terminals()
 
-        assert terminal_name not in culled
-        mock_server_app.terminal_manager.terminate.assert_not_called()
+class TestCullIdleTerminal:
+    """Test terminal culling functionality."""
 
-    @pytest.mark.asyncio
-    async def test_cull_terminal_with_iso_string(self, culler, mock_server_app):
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.mark.parametrize(
+        "last_activity,should_cull",
+        [
+            (_IDLE_TIME, True),
+            (_RECENT_TIME, False),
+            (_IDLE_TIME.isoformat(), True),
+            (_RECENT_TIME.isoformat(), False),
+        ],
+        ids=["idle", "recently_active", "idle_iso", "recently_active_iso"],
+    )
+    async def test_terminal_culling(
+        self, culler, mock_server_app, last_activity, should_cull
+    ):
         terminal_name = "terminal-1"
-        idle_time = (datetime.now(timezone.utc) - timedelta(minutes=120)).isoformat()
 
         mock_server_app.terminal_manager.list.return_value = [
-            {"name": terminal_name, "last_activity": idle_time}
+            {"name": terminal_name, "last_activity": last_activity}
         ]
 
         culled = await culler._cull_terminals()
 
-        assert terminal_name in culled
+        terminate = mock_server_app.terminal_manager.terminate
+        if should_cull:
+            assert culled == [terminal_name]
+            terminate.assert_called_once_with(terminal_name)
+        else:
+            assert culled == []
+            terminate.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_connected_terminal_not_culled(self, culler, mock_server_app):
         """DEF-1: an idle terminal reported open by a client is protected."""
         terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
 
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
@@ -250,11 +306,10 @@ class TestCullIdleTerminal:
         assert terminal_name not in culled
         mock_server_app.terminal_manager.terminate.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_disconnected_only_off_culls_connected(self, culler, mock_server_app):
         """With disconnected-only disabled, an idle terminal is culled regardless of tab."""
         terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
 
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
@@ -266,6 +321,31 @@ class TestCullIdleTerminal:
 
         assert terminal_name in culled
 
+    async def test_terminations_overlap_and_failures_isolated(self, culler, mock_server_app):
+        idle_time = _IDLE_TIME
+        mock_server_app.terminal_manager.list.return_value = [
+            {"name": name, "last_activity": idle_time} for name in ("1", "2", "3")
+        ]
+
+        in_flight = 0
+        peak = 0
+
+        async def terminate(name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if name == "2":
+                raise RuntimeError("boom")
+
+        mock_server_app.terminal_manager.terminate = terminate
+
+        culled = await culler._cull_terminals()
+
+        assert culled == ["1", "3"]
+        assert peak == 3
+
 
 def _pty_with_clients(n_clients: int) -> MagicMock:
     """Fake terminado PtyWithClients carrying n attached websocket clients."""
@@ -283,7 +363,7 @@ class TestWebsocketTabProtection:
         self, culler, mock_server_app
     ):
         terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
 
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
@@ -303,9 +383,9 @@ class TestWebsocketTabProtection:
     ):
         """Reports stale past the TTL, but the websocket is still attached."""
         terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
         stale_minutes = culler._cull_check_interval * culler._ACTIVE_TERMINAL_STALE_INTERVALS + 1
-        stale_time = datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)
+        stale_time = (datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)).timestamp()
 
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
@@ -313,7 +393,11 @@ class TestWebsocketTabProtection:
         mock_server_app.terminal_manager.terminals = {
             terminal_name: _pty_with_clients(1)
         }
-        culler._active_terminals_by_client["A"] = ({terminal_name}, stale_time)
+        culler._active_terminals_by_client["A"] = (
+            {terminal_name},
+            stale_time,
+            culler._cull_check_interval,
+        )
 
         culled = await culler._cull_terminals()
 
@@ -324,7 +408,7 @@ class TestWebsocketTabProtection:
     async def test_terminal_without_ws_clients_culled(self, culler, mock_server_app):
         """Terminal exists in the registry but has zero attached websockets."""
         terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
 
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
@@ -337,7 +421,8 @@ class TestWebsocketTabProtection:
 
         assert terminal_name in culled
 
-    def test_connection_status_reflects_ws_clients(self, culler, mock_server_app):
+    @pytest.mark.asyncio
+    async def test_connection_status_reflects_ws_clients(self, culler, mock_server_app):
         mock_server_app.terminal_manager.list.return_value = [
             {"name": "1"},
             {"name": "2"},
@@ -347,10 +432,56 @@ class TestWebsocketTabProtection:
             "2": _pty_with_clients(0),
         }
 
-        status = culler.get_terminals_connection_status()
+        status = await culler.get_terminals_connection_status_async()
 
         assert status == {"1": True, "2": False}
 
+    def test_open_tabs_union_ws_clients_and_reports(self, culler, mock_server_app):
+        mock_server_app.terminal_manager.terminals = {
+            "1": _pty_with_clients(1),
+            "2": _pty_with_clients(0),
+        }
+        culler.set_active_terminals(["3"], client_id="A")
+        assert culler._open_tab_terminals() == {"1", "3"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_polls_share_one_workspace_scan(
+        self, culler, mock_server_app
+    ):
+        mock_server_app.terminal_manager.list.return_value = [{"name": "1"}]
+        ws_mgr = culler._workspace_manager
+        ws_mgr.list_workspaces.return_value = [{"data": {"terminal:1": {}}}]
+        culler._WORKSPACE_LISTING_TTL_SECONDS = 0  # every scan hits the manager
+
+        results = await asyncio.gather(
+            *(culler.get_terminals_connection_status_async() for _ in range(5))
+        )
+
+        assert results == [{"1": True}] * 5
+        assert ws_mgr.list_workspaces.call_count == 1
+        assert culler._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_single_flight_error_reaches_every_waiter(self, culler):
+        def boom():
+            raise OSError("disk")
+
+        results = await asyncio.gather(
+            culler._single_flight("k", boom),
+            culler._single_flight("k", boom),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, OSError) for r in results)
+        assert culler._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_connection_status_listing_failure_propagates(self, culler, mock_server_app):
+        """DEF-10: no partial map - a missing name would read as unprotected."""
+        mock_server_app.terminal_manager.list.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            await culler.get_terminals_connection_status_async()
+
     def test_manager_without_registry_falls_back_to_reports(
         self, culler, mock_server_app
     ):
@@ -358,8 +489,8 @@ class TestWebsocketTabProtection:
         mock_server_app.terminal_manager.terminals = None
         culler.set_active_terminals(["1"], client_id="A")
 
-        assert culler._terminal_has_active_tab("1") is True
-        assert culler._terminal_has_active_tab("2") is False
+        assert "1" in culler._open_tab_terminals()
+        assert "2" not in culler._open_tab_terminals()
 
 
 class TestWorkspaceTerminalProtection:
@@ -379,7 +510,7 @@ class TestWorkspaceTerminalProtection:
         self, culler, mock_server_app
     ):
         """Idle, no tab, no reports - but the default workspace references it."""
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
         mock_server_app.terminal_manager.list.return_value = [
             {"name": "1", "last_activity": idle_time}
         ]
@@ -395,7 +526,7 @@ class TestWorkspaceTerminalProtection:
     @pytest.mark.asyncio
     async def test_listing_failure_fails_safe(self, culler, mock_server_app):
         """If workspace references cannot be verified, cull no terminals."""
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
         mock_server_app.terminal_manager.list.return_value = [
             {"name": "1", "last_activity": idle_time}
         ]
@@ -412,7 +543,7 @@ class TestWorkspaceTerminalProtection:
     ):
         """An idle auto-* workspace is culled first; the terminal only it
         referenced is culled in the same pass."""
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
         mock_server_app.terminal_manager.list.return_value = [
             {"name": "1", "last_activity": idle_time}
         ]
@@ -432,7 +563,7 @@ class TestWorkspaceTerminalProtection:
     ):
         """The culled workspace's terminal survives when another workspace
         that is not culled still references it."""
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
         mock_server_app.terminal_manager.list.return_value = [
             {"name": "1", "last_activity": idle_time}
         ]
@@ -471,7 +602,8 @@ class TestWorkspaceTerminalProtection:
         assert culled == []
         mock_server_app.terminal_manager.terminate.assert_not_called()
 
-    def test_connection_status_includes_workspace_reference(
+    @pytest.mark.asyncio
+    async def test_connection_status_includes_workspace_reference(
         self, culler, mock_server_app
     ):
         mock_server_app.terminal_manager.list.return_value = [
@@ -483,7 +615,7 @@ class TestWorkspaceTerminalProtection:
             self._ws("default", ["1"], idle_days=0)
         ]
 
-        status = culler.get_terminals_connection_status()
+        status = await culler.get_terminals_connection_status_async()
 
         assert status == {"1": True, "2": False}
 
@@ -492,27 +624,25 @@ class TestDisconnectGrace:
     """DEF-12: a terminal whose tab closed/disconnected gets a fresh idle
     timeout from that moment, so a transient websocket loss cannot cull it."""
 
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio
+
     async def test_recently_disconnected_terminal_not_culled(
         self, culler, mock_server_app
     ):
         """Idle 120 min, but the tab was still open 5 min ago."""
         terminal_name = "terminal-1"
-        idle_time = datetime.now(timezone.utc) - timedelta(minutes=120)
+        idle_time = _IDLE_TIME
 
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
         ]
-        culler._terminal_tab_last_seen[terminal_name] = datetime.now(
-            timezone.utc
-        ) - timedelta(minutes=5)
+        culler._terminal_tab_last_seen[terminal_name] = _RECENT_TIME.timestamp()
 
         culled = await culler._cull_terminals()
 
         assert terminal_name not in culled
         mock_server_app.terminal_manager.terminate.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_grace_expires_after_full_timeout(self, culler, mock_server_app):
         """Tab last seen 90 min ago with a 60 min timeout - grace is spent."""
         terminal_name = "terminal-1"
@@ -521,22 +651,21 @@ class TestDisconnectGrace:
         mock_server_app.terminal_manager.list.return_value = [
             {"name": terminal_name, "last_activity": idle_time}
         ]
-        culler._terminal_tab_last_seen[terminal_name] = datetime.now(
-            timezone.utc
-        ) - timedelta(minutes=90)
+        culler._terminal_tab_last_seen[terminal_name] = (
+            datetime.now(timezone.utc) - timedelta(minutes=90)
+        ).timestamp()
 
         culled = await culler._cull_terminals()
 
         assert terminal_name in culled
 
-    @pytest.mark.asyncio
     async def test_tab_last_seen_recorded_and_pruned(self, culler, mock_server_app):
         """An active tab stamps last-seen; vanished terminals are forgotten."""
         mock_server_app.terminal_manager.list.return_value = [
             {"name": "1", "last_activity": datetime.now(timezone.utc)}
         ]
         mock_server_app.terminal_manager.terminals = {"1": _pty_with_clients(1)}
-        culler._terminal_tab_last_seen["gone"] = datetime.now(timezone.utc)
+        culler._terminal_tab_last_seen["gone"] = datetime.now(timezone.utc).timestamp()
 
         await culler._cull_terminals()
 
@@ -544,24 +673,117 @@ class TestDisconnectGrace:
         assert "gone" not in culler._terminal_tab_last_seen
 
 
+class TestActivityEpochCache:
+    """Timestamps are parsed once per change, and only for live resources."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_timestamp_reused_and_pruned(self, culler, mock_server_app):
+        recent = _RECENT_TIME.isoformat()
+        mock_server_app.terminal_manager.list.return_value = [
+            {"name": "1", "last_activity": recent}
+        ]
+        with patch.object(ResourceCuller, "_to_epoch", wraps=ResourceCuller._to_epoch) as parse:
+            await culler._cull_terminals()
+            await culler._cull_terminals()
+        assert parse.call_count == 1
+
+        mock_server_app.terminal_manager.list.return_value = []
+        await culler._cull_terminals()
+        assert culler._activity_epochs["terminal"] == {}
+
+    def test_naive_datetime_is_utc(self):
+        naive = datetime(2026, 1, 1, 12, 0)
+        aware = naive.replace(tzinfo=timezone.utc)
+        assert ResourceCuller._to_epoch(naive) == aware.timestamp()
+        assert ResourceCuller._to_epoch("2026-01-01T12:00:00Z") == aware.timestamp()
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        from jupyterlab_kernel_terminal_workspace_culler_extension import culler as culler_mod
+
+        stamp = "2026-01-01T12:00:00.123456+02:00"
+        fast = ResourceCuller._to_epoch(stamp)
+        monkeypatch.setattr(culler_mod, "_parse_iso", None)
+        assert ResourceCuller._to_epoch(stamp) == fast
+
+    def test_pre_311_z_fallback(self, monkeypatch):
+        from jupyterlab_kernel_terminal_workspace_culler_extension import culler as culler_mod
+
+        monkeypatch.setattr(culler_mod, "_parse_iso", None)
+        native = ResourceCuller._to_epoch("2026-01-01T12:00:00Z")
+        monkeypatch.setattr(culler_mod, "_fromisoformat", culler_mod._fromisoformat_z)
+        assert ResourceCuller._to_epoch("2026-01-01T12:00:00Z") == native
+
+
+class TestEmptyFastPath:
+    """Idle servers skip listing work that cannot find anything to cull."""
+
+    pytestmark = pytest.mark.asyncio
+
+    async def test_empty_kernel_registry_skips_listing(self, culler, mock_server_app):
+        mock_server_app.kernel_manager._kernels = {}
+        await culler._cull_idle_resources()
+        mock_server_app.kernel_manager.list_kernel_ids.assert_not_called()
+
+    async def test_unknown_registry_still_swept(self, culler, mock_server_app):
+        del mock_server_app.kernel_manager._kernels
+        await culler._cull_idle_resources()
+        mock_server_app.kernel_manager.list_kernel_ids.assert_called_once()
+
+    async def test_no_terminals_skips_workspace_scan(self, culler):
+        culler._terminal_tab_last_seen["gone"] = 0.0
+        await culler._cull_terminals()
+        culler._workspace_manager.list_workspaces.assert_not_called()
+        assert culler._terminal_tab_last_seen == {}
+
+
+class TestManagerResolution:
+    """Managers are resolved once; a missing terminal manager is retried."""
+
+    def test_terminal_manager_cached(self, culler, mock_server_app):
+        mgr = culler.terminal_manager
+        mock_server_app.terminal_manager = MagicMock()
+        assert culler.terminal_manager is mgr
+
+    def test_late_terminal_manager_picked_up(self):
+        app = MagicMock(spec=["web_app"])
+        app.web_app.settings = {}
+        c = ResourceCuller(app)
+        assert c.terminal_manager is None
+
+        app.web_app.settings["terminal_manager"] = mgr = MagicMock()
+        assert c.terminal_manager is mgr
+
+
 class TestWorkspacesDirResolution:
     """DEF-11: the culler must use the workspaces dir the live server uses."""
 
     def test_extension_app_trait_wins(self, culler, mock_server_app, tmp_path):
         lab_app = MagicMock()
         lab_app.workspaces_dir = str(tmp_path / "ws")
-        mock_server_app.extension_manager.extension_apps = {"lab": {lab_app}}
+        mock_server_app.extension_manager = SimpleNamespace(
+            extension_apps={"lab": {lab_app}}
+        )
 
         assert culler._resolve_workspaces_dir() == tmp_path / "ws"
 
     def test_env_var_honoured_without_trait(
         self, culler, mock_server_app, tmp_path, monkeypatch
     ):
-        mock_server_app.extension_manager = None
         monkeypatch.setenv("JUPYTERLAB_WORKSPACES_DIR", str(tmp_path / "envws"))
 
         assert culler._resolve_workspaces_dir() == tmp_path / "envws"
 
+    def test_missing_dir_rechecked_only_after_interval(self, culler, tmp_path):
+        culler._workspace_manager = None
+        culler._workspaces_dir = tmp_path / "ws"
+
+        assert culler.workspace_manager is None
+        (tmp_path / "ws").mkdir()
+        assert culler.workspace_manager is None  # not re-statted yet
+
+        culler._workspace_manager_retry_at = 0.0
+        assert culler.workspace_manager is not None
+
 
 class TestActiveTerminals:
     """DEF-1: per-client active-terminal tracking with union and TTL."""
@@ -569,22 +791,59 @@ class TestActiveTerminals:
     def test_union_across_clients(self, culler):
         culler.set_active_terminals(["1"], client_id="A")
         culler.set_active_terminals(["2"], client_id="B")
-        assert culler._terminal_has_active_tab("1") is True
-        assert culler._terminal_has_active_tab("2") is True
+        assert "1" in culler._open_tab_terminals()
+        assert "2" in culler._open_tab_terminals()
 
     def test_empty_report_does_not_clobber(self, culler):
         """A second client's empty report must not wipe the first client's terminals."""
         culler.set_active_terminals(["1"], client_id="A")
         culler.set_active_terminals([], client_id="B")
-        assert culler._terminal_has_active_tab("1") is True
+        assert "1" in culler._open_tab_terminals()
+
+    def test_report_is_swapped_not_mutated(self, culler):
+        """A new report replaces the frozen name set; earlier snapshots stay intact."""
+        culler.set_active_terminals(["1"], client_id="A")
+        snapshot = culler._active_terminal_names()
+        culler.set_active_terminals(["2"], client_id="A")
+
+        assert isinstance(culler._active_terminals_by_client["A"][0], frozenset)
+        assert snapshot == {"1"}
+        assert culler._active_terminal_names() == {"2"}
+
+    def test_identical_repost_only_refreshes_report_time(self, culler):
+        culler.set_active_terminals(["1", "2"], client_id="A")
+        names, reported_at, _interval = culler._active_terminals_by_client["A"]
+        culler._active_terminals_by_client["A"] = (names, reported_at - 60, _interval)
+
+        culler.set_active_terminals(["2", "1"], client_id="A")
+
+        new_names, new_reported_at, _ = culler._active_terminals_by_client["A"]
+        assert new_names is names
+        assert new_reported_at > reported_at - 60
+
+    def test_union_snapshot_reused_until_reports_change(self, culler):
+        culler.set_active_terminals(["1"], client_id="A")
+        first = culler._active_terminal_names()
+        culler.set_active_terminals(["1"], client_id="A")  # same names: keep it
+        assert culler._active_terminal_names() is first
+
+        culler.set_active_terminals(["2"], client_id="B")
+        assert culler._active_terminal_names() == {"1", "2"}
+
+        stale_minutes = culler._cull_check_interval * culler._ACTIVE_TERMINAL_STALE_INTERVALS + 1
+        reported_at = culler._active_terminals_by_client["B"][1] - stale_minutes * 60
+        culler._active_terminals_by_client["B"] = (
+            frozenset({"2"}), reported_at, culler._cull_check_interval
+        )
+        assert culler._active_terminal_names() == {"1"}  # prune refreshed it
 
     def test_stale_client_expires(self, culler):
         """A client silent beyond the TTL stops protecting its terminals and is pruned."""
         stale_minutes = culler._cull_check_interval * culler._ACTIVE_TERMINAL_STALE_INTERVALS + 1
-        stale_time = datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)
+        stale_time = (datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)).timestamp()
         culler._active_terminals_by_client["A"] = ({"1"}, stale_time, culler._cull_check_interval)
 
-        assert culler._terminal_has_active_tab("1") is False
+        assert "1" not in culler._open_tab_terminals()
         assert "A" not in culler._active_terminals_by_client
 
     def test_client_judged_against_own_interval(self, culler):
@@ -595,15 +854,15 @@ class TestActiveTerminals:
         """
         client_interval = 30  # minutes; server default is 5
         age_minutes = culler._cull_check_interval * culler._ACTIVE_TERMINAL_STALE_INTERVALS + 5
-        reported_at = datetime.now(timezone.utc) - timedelta(minutes=age_minutes)
+        reported_at = (datetime.now(timezone.utc) - timedelta(minutes=age_minutes)).timestamp()
         culler._active_terminals_by_client["A"] = ({"1"}, reported_at, client_interval)
 
-        assert culler._terminal_has_active_tab("1") is True
+        assert "1" in culler._open_tab_terminals()
 
     def test_set_active_terminals_prunes_stale_clients(self, culler):
         """DEF-15: every report prunes, so the per-client map stays bounded."""
         stale_minutes = culler._cull_check_interval * culler._ACTIVE_TERMINAL_STALE_INTERVALS + 1
-        stale_time = datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)
+        stale_time = (datetime.now(timezone.utc) - timedelta(minutes=stale_minutes)).timestamp()
         culler._active_terminals_by_client["old"] = ({"1"}, stale_time, culler._cull_check_interval)
 
         culler.set_active_terminals(["2"], client_id="new")
@@ -657,7 +916,7 @@ class TestCullWorkspaces:
         ws_mgr.delete.assert_not_called()
 
     def test_recent_auto_not_culled(self, culler):
-        recent = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+        recent = _RECENT_TIME.isoformat()
         ws_mgr = MagicMock()
         ws_mgr.list_workspaces.return_value = [
             {"metadata": {"id": "auto-0", "last_modified": recent}}
@@ -669,6 +928,148 @@ class TestCullWorkspaces:
         assert culled == []
         ws_mgr.delete.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "idle_seconds, expected",
+        [(90, "1.5m"), (3599, "60.0m"), (3600, "1.0h"), (5400, "1.5h"), (86400, "1.0d")],
+    )
+    def test_idle_display_units(self, idle_seconds, expected):
+        from jupyterlab_kernel_terminal_workspace_culler_extension.culler import _fmt_idle
+
+        assert _fmt_idle(idle_seconds) == expected
+
+    def test_manual_cull_normalises_timestamps(self, culler):
+        """Z-suffixed strings and naive datetimes are both read as UTC."""
+        old = datetime.now(timezone.utc) - timedelta(days=10)
+        ws_mgr = MagicMock()
+        ws_mgr.list_workspaces.return_value = [
+            {"metadata": {"id": "auto-z", "last_modified": old.strftime("%Y-%m-%dT%H:%M:%SZ")}},
+            {"metadata": {"id": "auto-naive", "last_modified": old.replace(tzinfo=None)}},
+        ]
+        culler._workspace_manager = ws_mgr
+
+        result = culler.cull_workspaces_with_timeout(60, dry_run=True)
+
+        assert [(w["id"], w["idle_time"]) for w in result] == [
+            ("auto-z", "10.0d"),
+            ("auto-naive", "10.0d"),
+        ]
+        ws_mgr.delete.assert_not_called()
+
+    def _dir_backed_ws_mgr(self, tmp_path, ids, age):
+        """Manager mock whose workspaces_dir holds one file per listed id."""
+        stamp = (datetime.now(timezone.utc) - age).isoformat()
+        ws_mgr = MagicMock()
+        ws_mgr.workspaces_dir = tmp_path
+        ws_mgr.list_workspaces.return_value = [
+            {"metadata": {"id": wid, "last_modified": stamp}} for wid in ids
+        ]
+        for wid in ids:
+            (tmp_path / f"{wid}.jupyterlab-workspace").touch()
+        return ws_mgr
+
+    def test_listing_skipped_until_oldest_workspace_can_expire(self, culler, tmp_path):
+        ws_mgr = self._dir_backed_ws_mgr(tmp_path, ["auto-0"], timedelta(days=2))
+        culler._workspace_manager = ws_mgr
+        now = time.time()
+
+        assert culler._cull_workspaces(now) == []
+        assert culler._cull_workspaces(now + 3600) == []
+        assert ws_mgr.list_workspaces.call_count == 1
+
+        # a timeout change drops the bound and re-scans
+        culler.update_settings({"workspaceCullIdleTimeout": 24 * 60})
+        assert culler._workspace_oldest_epoch is None
+        assert culler._cull_workspaces(now + 3600) == ["auto-0"]
+        assert ws_mgr.list_workspaces.call_count == 2
+
+    def test_new_workspace_with_old_mtime_forces_rescan(self, culler, tmp_path):
+        """A restored or copied-in workspace must not wait behind the old bound."""
+        ws_mgr = self._dir_backed_ws_mgr(tmp_path, ["auto-0"], timedelta(days=2))
+        culler._workspace_manager = ws_mgr
+        assert culler._cull_workspaces() == []
+
+        old = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+        ws_mgr.list_workspaces.return_value.append(
+            {"metadata": {"id": "auto-restored", "last_modified": old}}
+        )
+        (tmp_path / "auto-restored.jupyterlab-workspace").touch()
+
+        assert culler._cull_workspaces() == ["auto-restored"]
+        assert ws_mgr.list_workspaces.call_count == 2
+
+    def test_unreadable_directory_disables_skip(self, culler):
+        ws_mgr = self._ws_mgr([])
+        ws_mgr.workspaces_dir = "/nonexistent/workspaces"
+        culler._workspace_manager = ws_mgr
+
+        culler._cull_workspaces()
+        culler._cull_workspaces()
+
+        assert ws_mgr.list_workspaces.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_manual_cull_waits_for_running_sweep(self, culler):
+        ws_mgr = self._ws_mgr(["auto-0"])
+        culler._workspace_manager = ws_mgr
+
+        async with culler._sweep_lock:
+            task = asyncio.create_task(culler.cull_workspaces_with_timeout_async(60))
+            await asyncio.sleep(0.05)
+            ws_mgr.delete.assert_not_called()
+        result = await task
+
+        assert [w["id"] for w in result] == ["auto-0"]
+        ws_mgr.delete.assert_called_once_with("auto-0")
+
+
+class TestWorkspaceListingCache:
+    """Polls reuse a recent workspace listing; cull decisions never do."""
+
+    def test_polls_reuse_listing_within_ttl(self, culler):
+        culler.list_workspaces()
+        culler._workspace_referenced_terminals()
+        assert culler._workspace_manager.list_workspaces.call_count == 1
+
+    def test_listing_expires(self, culler):
+        culler.list_workspaces()
+        listed_at, ws_mgr, workspaces = culler._ws_cache
+        culler._ws_cache = (listed_at - culler._WORKSPACE_LISTING_TTL_SECONDS, ws_mgr, workspaces)
+        culler.list_workspaces()
+        assert culler._workspace_manager.list_workspaces.call_count == 2
+
+    def test_cull_relists_and_delete_invalidates(self, culler):
+        old = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+        ws_mgr = culler._workspace_manager
+        ws_mgr.list_workspaces.return_value = [{"metadata": {"id": "auto-0", "last_modified": old}}]
+        culler.list_workspaces()
+
+        assert culler._cull_workspaces() == ["auto-0"]
+        assert ws_mgr.list_workspaces.call_count == 2
+        assert culler._ws_cache is None
+
+    @pytest.mark.asyncio
+    async def test_terminal_cull_relists_references(self, culler, mock_server_app):
+        """A workspace saved after a poll cached the listing still protects its terminal."""
+        ws_mgr = culler._workspace_manager
+        culler.list_workspaces()  # a poll caches the empty listing
+        ws_mgr.list_workspaces.return_value = [
+            {"metadata": {"id": "auto-0"}, "data": {"terminal:1": {}}}
+        ]
+        mock_server_app.terminal_manager.list.return_value = [
+            {"name": "1", "last_activity": _IDLE_TIME}
+        ]
+
+        assert await culler._cull_terminals() == []
+        assert ws_mgr.list_workspaces.call_count == 2
+        mock_server_app.terminal_manager.terminate.assert_not_called()
+
+    def test_errors_not_cached(self, culler):
+        ws_mgr = culler._workspace_manager
+        ws_mgr.list_workspaces.side_effect = OSError("disk")
+        assert culler._workspace_referenced_terminals() is None
+        ws_mgr.list_workspaces.side_effect = None
+        assert culler._workspace_referenced_terminals() == set()
+
 
 class TestCullResult:
     """Test cull result retrieval."""
@@ -680,21 +1081,81 @@ class TestCullResult:
         assert result["workspaces_culled"] == []
 
     def test_result_consumed_flag(self, culler):
-        # First call returns empty (result_consumed True initially)
-        culler.get_last_cull_result()
-
-        culler._last_cull_result = {
+        culler._pending_results.append({
             "kernels_culled": ["kernel-1"],
             "terminals_culled": [],
             "workspaces_culled": [],
-        }
-        culler._result_consumed = False
+        })
+
+        result = culler.get_last_cull_result()
+        assert result["kernels_culled"] == ["kernel-1"]
+
+        # A result is handed out once, then consumed
+        result = culler.get_last_cull_result()
+        assert result["kernels_culled"] == []
+
+    def test_results_of_consecutive_sweeps_merged(self, culler):
+        culler._pending_results.append(
+            {"kernels_culled": ["k1"], "terminals_culled": [], "workspaces_culled": []}
+        )
+        culler._pending_results.append(
+            {"kernels_culled": ["k2"], "terminals_culled": ["1"], "workspaces_culled": []}
+        )
+
+        result = culler.get_last_cull_result()
 
-        result2 = culler.get_last_cull_result()
-        assert result2["kernels_culled"] == ["kernel-1"]
+        assert result["kernels_culled"] == ["k1", "k2"]
+        assert result["terminals_culled"] == ["1"]
 
-        result3 = culler.get_last_cull_result()
-        assert result3["kernels_culled"] == []
+    @pytest.mark.asyncio
+    async def test_sweep_logs_one_truncated_summary(self, culler, mock_server_app, caplog):
+        mock_kernel = MagicMock()
+        mock_kernel.execution_state = "idle"
+        mock_kernel.last_activity = _IDLE_TIME
+        kernel_ids = [f"k{i}" for i in range(8)]
+        mock_server_app.kernel_manager.list_kernel_ids.return_value = kernel_ids
+        mock_server_app.kernel_manager.get_kernel.return_value = mock_kernel
+
+        with caplog.at_level("INFO"):
+            await culler._sweep()
+
+        culler_lines = [r.getMessage() for r in caplog.records if "[Culler]" in r.getMessage()]
+        assert culler_lines == [
+            f"[Culler] Swept: kernels=8 {kernel_ids[:5]}, terminals=0 [], workspaces=0 []"
+        ]
+
+    def test_pending_results_bounded(self, culler):
+        for i in range(culler._PENDING_RESULTS_MAX + 5):
+            culler._pending_results.append(
+                {"kernels_culled": [f"k{i}"], "terminals_culled": [], "workspaces_culled": []}
+            )
+
+        result = culler.get_last_cull_result()
+
+        assert len(result["kernels_culled"]) == culler._PENDING_RESULTS_MAX
+        assert result["kernels_culled"][-1] == f"k{culler._PENDING_RESULTS_MAX + 4}"
+
+    @pytest.mark.asyncio
+    async def test_long_poll_woken_by_sweep(self, culler, mock_server_app):
+        kernel = MagicMock()
+        kernel.execution_state = "idle"
+        kernel.last_activity = _IDLE_TIME
+        mock_server_app.kernel_manager.list_kernel_ids.return_value = ["kernel-1"]
+        mock_server_app.kernel_manager.get_kernel.return_value = kernel
+
+        waiter = asyncio.ensure_future(culler.wait_for_cull_result(timeout=5))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await culler._cull_idle_resources()
+
+        assert (await waiter)["kernels_culled"] == ["kernel-1"]
+        assert not culler._result_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_long_poll_timeout_returns_empty(self, culler):
+        result = await culler.wait_for_cull_result(timeout=0.01)
+        assert result["kernels_culled"] == []
 
 
 class TestStatus:
@@ -703,13 +1164,137 @@ class TestStatus:
     def test_status_not_running(self, culler):
         status = culler.get_status()
         assert status["running"] is False
+        assert status["settings"] == culler.get_settings()
 
     def test_status_running(self, culler):
-        with patch.object(culler, "_periodic_callback", MagicMock()):
-            status = culler.get_status()
-            assert status["running"] is True
-
-    def test_status_includes_settings(self, culler):
+        culler._running = True
         status = culler.get_status()
-        assert "settings" in status
-        assert "kernelCullEnabled" in status["settings"]
+        assert status["running"] is True
+
+    def test_status_reused_until_something_changes(self, culler):
+        first = culler.get_status()
+        assert culler.get_status() is first
+
+        culler.update_settings({"kernelCullIdleTimeout": 90})
+        updated = culler.get_status()
+        assert updated is not first
+        assert updated["settings"]["kernelCullIdleTimeout"] == 90
+
+        culler._running = True
+        assert culler.get_status()["running"] is True
+
+
+class TestAdaptiveScheduling:
+    """Sweeps are one-shot timeouts that wake early for imminent expiries."""
+
+    @pytest.fixture
+    def io_loop(self):
+        loop = MagicMock()
+        with patch(
+            "jupyterlab_kernel_terminal_workspace_culler_extension.culler.IOLoop.current",
+            return_value=loop,
+        ):
+            yield loop
+
+    def test_start_and_stop_manage_timeout(self, culler, io_loop):
+        culler.start()
+        io_loop.call_later.assert_called_once_with(300, culler._run_scheduled_sweep)
+        assert culler.get_status()["running"] is True
+
+        culler.stop()
+        io_loop.remove_timeout.assert_called_once_with(io_loop.call_later.return_value)
+        assert culler.get_status()["running"] is False
+
+    def test_timer_parked_while_everything_disabled(self, culler, io_loop):
+        culler.start()
+        culler.update_settings({
+            "kernelCullEnabled": False,
+            "terminalCullEnabled": False,
+            "workspaceCullEnabled": False,
+        })
+        io_loop.remove_timeout.assert_called_once_with(io_loop.call_later.return_value)
+        assert culler._timeout_handle is None
+        assert culler.get_status()["running"] is True
+
+        culler.update_settings({"terminalCullEnabled": True})
+        assert io_loop.call_later.call_count == 2
+        assert culler._timeout_handle is io_loop.call_later.return_value
+
+    def test_start_with_everything_disabled_arms_nothing(self, culler, io_loop):
+        culler.update_settings({
+            "kernelCullEnabled": False,
+            "terminalCullEnabled": False,
+            "workspaceCullEnabled": False,
+        })
+        culler.start()
+        io_loop.call_later.assert_not_called()
+
+    def test_delay_defaults_to_interval(self, culler):
+        assert culler._early_wakeup_delay() == 300
+
+    def test_delay_clamped_to_bounds(self, culler):
+        culler._note_expiry(10_000)
+        assert culler._early_wakeup_delay() == 300  # never later than the interval
+        culler._note_expiry(120)
+        assert culler._early_wakeup_delay() == 120
+        culler._note_expiry(5)
+        assert culler._early_wakeup_delay() == culler._MIN_CHECK_DELAY_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_sweep_reschedules_for_nearest_kernel_expiry(
+        self, culler, mock_server_app, io_loop
+    ):
+        kernel = MagicMock()
+        kernel.execution_state = "idle"
+        kernel.last_activity = datetime.now(timezone.utc) - timedelta(minutes=58)
+        mock_server_app.kernel_manager.list_kernel_ids.return_value = ["kernel-1"]
+        mock_server_app.kernel_manager.get_kernel.return_value = kernel
+
+        culler._running = True
+        await culler._run_scheduled_sweep()
+
+        delay = io_loop.call_later.call_args.args[0]
+        assert 115 <= delay <= 120
+
+    @pytest.mark.asyncio
+    async def test_next_sweep_armed_only_after_sweep_finishes(self, culler, io_loop):
+        """A slow sweep delays the next one instead of overlapping it."""
+        release = asyncio.Event()
+
+        async def slow_sweep():
+            await release.wait()
+            raise RuntimeError("sweep failed")
+
+        culler._running = True
+        with patch.object(culler, "_sweep", side_effect=slow_sweep):
+            task = asyncio.ensure_future(culler._run_scheduled_sweep())
+            await asyncio.sleep(0)
+            io_loop.call_later.assert_not_called()
+            release.set()
+            with pytest.raises(RuntimeError):
+                await task
+
+        # rescheduled even though the sweep raised
+        io_loop.call_later.assert_called_once_with(300, culler._run_scheduled_sweep)
+
+    @pytest.mark.asyncio
+    async def test_overlapping_sweep_dropped(self, culler, mock_server_app):
+        release = asyncio.Event()
+
+        async def slow_shutdown(kernel_id):
+            await release.wait()
+
+        kernel = MagicMock()
+        kernel.execution_state = "idle"
+        kernel.last_activity = _IDLE_TIME
+        mock_server_app.kernel_manager.list_kernel_ids.return_value = ["kernel-1"]
+        mock_server_app.kernel_manager.get_kernel.return_value = kernel
+        mock_server_app.kernel_manager.shutdown_kernel = AsyncMock(side_effect=slow_shutdown)
+
+        first = asyncio.ensure_future(culler._cull_idle_resources())
+        await asyncio.sleep(0)
+        await culler._cull_idle_resources()  # returns at once: first still holds the lock
+        release.set()
+        await first
+
+        mock_server_app.kernel_manager.shutdown_kernel.assert_awaited_once_with("kernel-1")
@@ -17,6 +17,48 @@ async def test_status_endpoint(jp_fetch):
     assert payload["settings"]["kernelCullEnabled"] is True
 
 
+async def test_status_reflects_settings_update(jp_fetch):
+    """The cached status body is re-encoded once a setting changes."""
+    await jp_fetch(NAMESPACE, "status")
+    await jp_fetch(
+        NAMESPACE,
+        "settings",
+        method="POST",
+        body=json.dumps({"kernelCullIdleTimeout": 42}),
+    )
+
+    response = await jp_fetch(NAMESPACE, "status")
+
+    assert json.loads(response.body)["settings"]["kernelCullIdleTimeout"] == 42
+
+
+async def test_culler_started_on_event_loop(jp_fetch):
+    """The culler is started from the io loop after extension load."""
+    # When
+    response = await jp_fetch(NAMESPACE, "status")
+
+    # Then
+    assert json.loads(response.body)["running"] is True
+
+
+def test_dumps_stdlib_fallback(monkeypatch):
+    """Without orjson, bodies are encoded by the stdlib to the same JSON."""
+    from jupyterlab_kernel_terminal_workspace_culler_extension import routes
+
+    payload = {"terminal-1": True, "ids": ["a", "b"]}
+    encoded = routes._dumps(payload)
+    monkeypatch.setattr(routes, "orjson", None)
+    assert json.loads(routes._dumps(payload)) == json.loads(encoded) == payload
+
+
+def test_get_culler_single_source():
+    """The package-level accessor reads the reference held by routes."""
+    import jupyterlab_kernel_terminal_workspace_culler_extension as ext
+    from jupyterlab_kernel_terminal_workspace_culler_extension import routes
+
+    assert ext.get_culler is routes.get_culler
+
+
 async def test_cull_result_endpoint(jp_fetch):
     # When
     response = await jp_fetch(NAMESPACE, "cull-result")
@@ -31,6 +73,25 @@ async def test_cull_result_endpoint(jp_fetch):
     }
 
 
+async def test_cull_result_long_poll_times_out_empty(jp_fetch):
+    # When
+    response = await jp_fetch(NAMESPACE, "cull-result", params={"wait": "0.05"})
+
+    # Then
+    assert response.code == 200
+    assert json.loads(response.body)["kernels_culled"] == []
+
+
+async def test_cull_result_bad_wait_rejected(jp_fetch):
+    import tornado.httpclient
+    import pytest
+
+    for wait in ("soon", "-1", "3600"):
+        with pytest.raises(tornado.httpclient.HTTPClientError) as exc_info:
+            await jp_fetch(NAMESPACE, "cull-result", params={"wait": wait})
+        assert exc_info.value.code == 400, wait
+
+
 async def test_active_terminals_endpoint(jp_fetch):
     # When
     response = await jp_fetch(